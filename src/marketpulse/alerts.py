@@ -0,0 +1,327 @@
+"""Rule-based alerts evaluated against snapshot state."""
+
+from __future__ import annotations
+
+import json
+import time
+from abc import ABC, abstractmethod
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Sequence, Union
+
+import numpy as np
+import requests
+
+from marketpulse.engine import SIGNAL_NAMES
+from marketpulse.models import MarketPulseSnapshot, Vote
+from marketpulse.utils import ensure_dir, read_json_or_none, write_json_atomic
+
+VOTE_CODES = {Vote.BULL: 1.0, Vote.NEUTRAL: 0.0, Vote.BEAR: -1.0, Vote.NA: np.nan}
+
+ABOVE = "above"
+BELOW = "below"
+CHANGE = "change"
+STREAK = "streak"
+RULE_KINDS = (ABOVE, BELOW, CHANGE, STREAK)
+KIND_CODES = {kind: code for code, kind in enumerate(RULE_KINDS)}
+SNAPSHOT_FIELDS = ("score", "label")
+SIGNAL_FIELD_PREFIXES = ("vote", "value")
+
+
+@dataclass(frozen=True)
+class AlertRule:
+    """A check on one state field.
+
+    Fields are ``score``, ``label``, ``vote:<signal>`` and ``value:<signal>``;
+    labels and votes are coded BULL=1, NEUTRAL=0, BEAR=-1. ``above``/``below``
+    fire when the field crosses ``threshold``, ``change`` whenever it differs
+    from the previous evaluation and ``streak`` when it has equalled ``target``
+    for ``count`` consecutive snapshot dates (re-evaluating the same ``as_of``
+    does not extend a streak). ``cooldown`` (seconds) debounces repeat firings.
+    """
+
+    id: str
+    kind: str
+    field: str
+    threshold: Optional[float] = None
+    target: Optional[Union[float, str]] = None
+    count: int = 1
+    cooldown: float = 0.0
+    message: str = ""
+
+
+@dataclass(frozen=True)
+class Alert:
+    rule_id: str
+    key: str
+    field: str
+    value: Optional[float]
+    message: str
+    fired_at: float
+
+
+def snapshot_state(snapshot: MarketPulseSnapshot) -> Dict[str, float]:
+    state = {"score": float(snapshot.score), "label": VOTE_CODES[snapshot.label]}
+    for signal in snapshot.signals:
+        state[f"vote:{signal.name}"] = VOTE_CODES[signal.vote]
+        state[f"value:{signal.name}"] = np.nan if signal.value is None else float(signal.value)
+    return state
+
+
+def _code(value: Optional[Union[float, str]]) -> float:
+    if value is None:
+        return np.nan
+    if isinstance(value, str):
+        return VOTE_CODES[Vote(value)]
+    return float(value)
+
+
+def validate_rule(rule: AlertRule) -> None:
+    """Reject rules that would compile but could never fire."""
+    if rule.kind not in RULE_KINDS:
+        raise ValueError(f"Unknown alert kind for {rule.id}: {rule.kind}")
+    prefix, _, name = rule.field.partition(":")
+    if rule.field not in SNAPSHOT_FIELDS and not (prefix in SIGNAL_FIELD_PREFIXES and name in SIGNAL_NAMES):
+        raise ValueError(
+            f"Unknown alert field for {rule.id}: {rule.field!r} "
+            "(expected score, label, vote:<signal> or value:<signal>)"
+        )
+    if rule.kind in (ABOVE, BELOW) and rule.threshold is None:
+        raise ValueError(f"Alert rule {rule.id} ({rule.kind}) needs a threshold")
+    if rule.kind == STREAK and rule.target is None:
+        raise ValueError(f"Alert rule {rule.id} (streak) needs a target")
+
+
+class CompiledRules:
+    """Rules flattened into parallel arrays so every rule is checked in one pass."""
+
+    def __init__(self, rules: Sequence[AlertRule]) -> None:
+        for rule in rules:
+            validate_rule(rule)
+        self.rules = list(rules)
+        self.ids = [rule.id for rule in self.rules]
+        self.fields = sorted({rule.field for rule in self.rules})
+        field_index = {field: index for index, field in enumerate(self.fields)}
+        self.field_idx = np.array([field_index[rule.field] for rule in self.rules], dtype=np.intp)
+        self.kind = np.array([KIND_CODES[rule.kind] for rule in self.rules], dtype=np.int8)
+        self.threshold = np.array([_code(rule.threshold) for rule in self.rules])
+        self.target = np.array([_code(rule.target) for rule in self.rules])
+        self.count = np.array([max(rule.count, 1) for rule in self.rules])
+        self.cooldown = np.array([rule.cooldown for rule in self.rules])
+
+    def __len__(self) -> int:
+        return len(self.rules)
+
+    def vector(self, state: Dict[str, float]) -> np.ndarray:
+        return np.array([state.get(field, np.nan) for field in self.fields])
+
+
+class AlertState:
+    """Per-key memory of field values, rule conditions, streaks and last firing.
+
+    ``prior_streak`` is the streak before the current ``as_of`` was first seen,
+    so repeated evaluations of one snapshot date recompute rather than extend it.
+    """
+
+    def __init__(self, fields: List[str], rule_ids: List[str]) -> None:
+        self.fields = fields
+        self.rule_ids = rule_ids
+        self.as_of: Optional[str] = None
+        self.values = np.full(len(fields), np.nan)
+        self.active = np.zeros(len(rule_ids), dtype=bool)
+        self.streak = np.zeros(len(rule_ids), dtype=np.int64)
+        self.prior_streak = np.zeros(len(rule_ids), dtype=np.int64)
+        self.last_fired = np.full(len(rule_ids), -np.inf)
+
+    def to_dict(self) -> dict:
+        return {
+            "as_of": self.as_of,
+            "values": {f: (None if np.isnan(v) else float(v)) for f, v in zip(self.fields, self.values)},
+            "rules": {
+                rule_id: {
+                    "active": bool(active),
+                    "streak": int(streak),
+                    "prior_streak": int(prior),
+                    "last_fired": None if np.isinf(fired) else float(fired),
+                }
+                for rule_id, active, streak, prior, fired in zip(
+                    self.rule_ids, self.active, self.streak, self.prior_streak, self.last_fired
+                )
+            },
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict, fields: List[str], rule_ids: List[str]) -> "AlertState":
+        state = cls(fields, rule_ids)
+        state.as_of = data.get("as_of")
+        values = data.get("values", {})
+        rules = data.get("rules", {})
+        for index, field in enumerate(fields):
+            if values.get(field) is not None:
+                state.values[index] = values[field]
+        for index, rule_id in enumerate(rule_ids):
+            saved = rules.get(rule_id)
+            if saved is None:
+                continue
+            state.active[index] = saved.get("active", False)
+            state.streak[index] = saved.get("streak", 0)
+            state.prior_streak[index] = saved.get("prior_streak", 0)
+            if saved.get("last_fired") is not None:
+                state.last_fired[index] = saved["last_fired"]
+        return state
+
+
+class AlertSink(ABC):
+    @abstractmethod
+    def deliver(self, alerts: List[Alert]) -> None:
+        raise NotImplementedError
+
+
+class StdoutSink(AlertSink):
+    def deliver(self, alerts: List[Alert]) -> None:
+        for alert in alerts:
+            print(f"[{alert.key}] {alert.message}")
+
+
+class FileSink(AlertSink):
+    def __init__(self, path: Path) -> None:
+        self.path = Path(path)
+
+    def deliver(self, alerts: List[Alert]) -> None:
+        ensure_dir(self.path.parent)
+        with self.path.open("a", encoding="utf-8") as handle:
+            for alert in alerts:
+                handle.write(json.dumps(asdict(alert)) + "\n")
+
+
+class WebhookSink(AlertSink):
+    def __init__(self, url: str = "http://127.0.0.1:8765/alerts", timeout: float = 5.0) -> None:
+        self.url = url
+        self.timeout = timeout
+
+    def deliver(self, alerts: List[Alert]) -> None:
+        response = requests.post(self.url, json=[asdict(alert) for alert in alerts], timeout=self.timeout)
+        response.raise_for_status()
+
+
+def _sink_from_spec(spec: dict) -> AlertSink:
+    kind = spec.get("type")
+    if kind == "stdout":
+        return StdoutSink()
+    if kind == "file":
+        return FileSink(Path(spec["path"]).expanduser())
+    if kind == "webhook":
+        return WebhookSink(spec.get("url", "http://127.0.0.1:8765/alerts"))
+    raise ValueError(f"Unknown alert sink: {kind}")
+
+
+class AlertEngine:
+    def __init__(
+        self,
+        rules: Sequence[AlertRule],
+        sinks: Optional[List[AlertSink]] = None,
+        state_path: Optional[Path] = None,
+    ) -> None:
+        self.compiled = CompiledRules(rules)
+        self.sinks = sinks if sinks is not None else [StdoutSink()]
+        self.state_path = state_path
+        self.states: Dict[str, AlertState] = {}
+        self.errors: List[str] = []
+        self._load_state()
+
+    @classmethod
+    def from_file(cls, path: Path, state_path: Optional[Path] = None) -> "AlertEngine":
+        data = json.loads(Path(path).read_text(encoding="utf-8"))
+        rules = [AlertRule(**rule) for rule in data.get("rules", [])]
+        sinks = [_sink_from_spec(spec) for spec in data.get("sinks", [{"type": "stdout"}])]
+        return cls(rules, sinks=sinks, state_path=state_path)
+
+    def _state(self, key: str) -> AlertState:
+        if key not in self.states:
+            self.states[key] = AlertState(self.compiled.fields, self.compiled.ids)
+        return self.states[key]
+
+    def _load_state(self) -> None:
+        """Restore saved state; a missing or corrupt file starts from a clean slate."""
+        if self.state_path is None:
+            return
+        saved = read_json_or_none(self.state_path)
+        if not isinstance(saved, dict):
+            return
+        for key, data in saved.items():
+            self.states[key] = AlertState.from_dict(data, self.compiled.fields, self.compiled.ids)
+
+    def save_state(self) -> None:
+        if self.state_path is None:
+            return
+        write_json_atomic(self.state_path, {key: state.to_dict() for key, state in self.states.items()})
+
+    def check(
+        self, key: str, state: Dict[str, float], now: Optional[float] = None, as_of: Optional[str] = None
+    ) -> List[Alert]:
+        """Evaluate every rule against ``state`` and update the memory for ``key``.
+
+        Streaks advance once per distinct ``as_of``; without one, every call
+        counts as a new observation.
+        """
+        now = time.time() if now is None else now
+        rules = self.compiled
+        memory = self._state(key)
+        current = rules.vector(state)
+        x = current[rules.field_idx]
+        previous = memory.values[rules.field_idx]
+        if as_of is None or as_of != memory.as_of:
+            memory.prior_streak = memory.streak
+            memory.as_of = as_of
+
+        with np.errstate(invalid="ignore"):
+            matches = x == rules.target
+            streak = np.where(matches, memory.prior_streak + 1, 0)
+            condition = np.select(
+                [rules.kind == KIND_CODES[kind] for kind in RULE_KINDS],
+                [
+                    x > rules.threshold,
+                    x < rules.threshold,
+                    np.isfinite(x) & np.isfinite(previous) & (x != previous),
+                    streak >= rules.count,
+                ],
+                default=False,
+            )
+        is_change = rules.kind == KIND_CODES[CHANGE]
+        rising = np.where(is_change, condition, condition & ~memory.active)
+        fire = rising & (now - memory.last_fired >= rules.cooldown)
+
+        memory.values = np.where(np.isnan(current), memory.values, current)
+        memory.active = condition
+        memory.streak = streak
+        memory.last_fired = np.where(fire, now, memory.last_fired)
+
+        alerts = []
+        for index in np.flatnonzero(fire):
+            rule = rules.rules[index]
+            value = None if np.isnan(x[index]) else float(x[index])
+            message = rule.message or f"{rule.id}: {rule.field} {rule.kind}"
+            alerts.append(Alert(rule.id, key, rule.field, value, message, now))
+        return alerts
+
+    def evaluate(
+        self, snapshots: Union[MarketPulseSnapshot, Dict[str, MarketPulseSnapshot]], now: Optional[float] = None
+    ) -> List[Alert]:
+        """Check one snapshot (key ``market``) or a keyed universe, then deliver and persist."""
+        if isinstance(snapshots, MarketPulseSnapshot):
+            snapshots = {"market": snapshots}
+        alerts: List[Alert] = []
+        for key, snapshot in snapshots.items():
+            alerts.extend(self.check(key, snapshot_state(snapshot), now, as_of=snapshot.as_of))
+        if alerts:
+            self.deliver(alerts)
+        self.save_state()
+        return alerts
+
+    def deliver(self, alerts: Iterable[Alert]) -> None:
+        alerts = list(alerts)
+        for sink in self.sinks:
+            try:
+                sink.deliver(alerts)
+            except Exception as exc:
+                self.errors.append(str(exc))
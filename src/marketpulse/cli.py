@@ -3,14 +3,21 @@
 from __future__ import annotations
 
 import json
-from dataclasses import asdict
+import sys
+from dataclasses import asdict, replace
 from enum import Enum
+from typing import Optional
 
 import typer
 
+from marketpulse.alerts import AlertEngine
 from marketpulse.config import DEFAULT_CONFIG
 from marketpulse.dashboard import DashboardApp
-from marketpulse.engine import build_snapshot
+from marketpulse.engine import build_snapshot, load_data
+from marketpulse.feed import SnapshotFeed, encode_binary
+from marketpulse.lookback import plan_lookback
+from marketpulse.models import MarketPulseSnapshot
+from marketpulse.robustness import estimate_band
 from marketpulse.summary import summary_text
 
 app = typer.Typer(add_completion=False)
@@ -22,10 +29,32 @@ def run() -> None:
     DashboardApp(DEFAULT_CONFIG).run()
 
 
+ROBUST_OPTION = typer.Option(False, "--robust", help="Add a bootstrap confidence band for the score.")
+SAMPLES_OPTION = typer.Option(None, "--samples", min=1, help="Bootstrap resamples for --robust.")
+SEED_OPTION = typer.Option(None, "--seed", help="Random seed for --robust.")
+
+
+def _build(robust: bool, samples: Optional[int], seed: Optional[int]) -> MarketPulseSnapshot:
+    if not robust:
+        return build_snapshot(DEFAULT_CONFIG)
+    config = DEFAULT_CONFIG
+    if samples is not None:
+        config = replace(config, robust_samples=samples)
+    if seed is not None:
+        config = replace(config, robust_seed=seed)
+    bundle = load_data(plan=plan_lookback(config, robust=True))
+    snap = build_snapshot(config, bundle)
+    return replace(snap, band=estimate_band(bundle, config))
+
+
 @app.command()
-def snapshot() -> None:
+def snapshot(
+    robust: bool = ROBUST_OPTION,
+    samples: Optional[int] = SAMPLES_OPTION,
+    seed: Optional[int] = SEED_OPTION,
+) -> None:
     """Print a shareable daily summary."""
-    snap = build_snapshot(DEFAULT_CONFIG)
+    snap = _build(robust, samples, seed)
     typer.echo(summary_text(snap))
 
 
@@ -41,8 +70,66 @@ def _serialize(obj):
 
 
 @app.command()
-def export(json_output: bool = typer.Option(True, "--json")) -> None:
+def export(
+    json_output: bool = typer.Option(True, "--json"),
+    robust: bool = ROBUST_OPTION,
+    samples: Optional[int] = SAMPLES_OPTION,
+    seed: Optional[int] = SEED_OPTION,
+) -> None:
     """Export computed signals."""
-    snap = build_snapshot(DEFAULT_CONFIG)
+    snap = _build(robust, samples, seed)
     if json_output:
         typer.echo(json.dumps(_serialize(asdict(snap)), indent=2))
+
+
+@app.command()
+def alerts() -> None:
+    """Evaluate alert rules against a fresh snapshot."""
+    path = DEFAULT_CONFIG.alerts_path
+    if not path.exists():
+        typer.echo(f"No alert rules found at {path}")
+        raise typer.Exit(code=1)
+    try:
+        engine = AlertEngine.from_file(path, state_path=DEFAULT_CONFIG.alert_state_path)
+    except (KeyError, TypeError, ValueError) as exc:
+        typer.echo(f"Invalid alert rules in {path}: {exc}", err=True)
+        raise typer.Exit(code=1)
+    fired = engine.evaluate(build_snapshot(DEFAULT_CONFIG))
+    for error in engine.errors:
+        typer.echo(f"Alert delivery failed: {error}", err=True)
+    if not fired:
+        typer.echo("No alerts fired")
+
+
+@app.command()
+def doctor() -> None:
+    """Check the full input history for data-quality issues."""
+    bundle = load_data()
+    if not bundle.has_breadth:
+        typer.echo("- breadth: unavailable")
+    if not bundle.quality:
+        typer.echo("No data quality issues found")
+        return
+    for issue in bundle.quality:
+        typer.echo(f"- {issue}")
+
+
+class FeedFormat(str, Enum):
+    json = "json"
+    binary = "binary"
+
+
+@app.command()
+def feed(
+    since: int = typer.Option(0, "--since", help="Last sequence number the client has; 0 for a full snapshot."),
+    output_format: FeedFormat = typer.Option(FeedFormat.json, "--format"),
+) -> None:
+    """Publish a fresh snapshot to the feed and print changes since a sequence number."""
+    snapshot_feed = SnapshotFeed(path=DEFAULT_CONFIG.feed_path)
+    snapshot_feed.publish(build_snapshot(DEFAULT_CONFIG))
+    message = snapshot_feed.changes_since(since)
+    if output_format is FeedFormat.binary:
+        sys.stdout.buffer.write(encode_binary(message))
+        sys.stdout.buffer.flush()
+    else:
+        typer.echo(json.dumps(message, separators=(",", ":")))
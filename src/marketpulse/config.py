@@ -4,6 +4,7 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from pathlib import Path
+from typing import Optional
 
 
 
@@ -12,8 +13,18 @@ class MarketPulseConfig:
     refresh_seconds: int = 60
     vix_bull: float = 20.0
     vix_neutral: float = 25.0
+    rank_window: int = 252
+    vix_pct_bull: float = 50.0
+    vix_pct_neutral: float = 80.0
+    score_rank_signals: bool = False
     score_bull: int = 60
     score_neutral: int = 40
+    lookback_tolerance: float = 1e-3
+    robust_samples: int = 1000
+    robust_seed: Optional[int] = None
+    robust_horizon: int = 63
+    robust_block: int = 5
+    robust_window_jitter: float = 0.2
 
     @property
     def data_dir(self) -> Path:
@@ -23,5 +34,21 @@ class MarketPulseConfig:
     def cache_dir(self) -> Path:
         return Path.home() / ".marketpulse" / "cache"
 
+    @property
+    def alerts_path(self) -> Path:
+        return Path.home() / ".marketpulse" / "alerts.json"
+
+    @property
+    def alert_state_path(self) -> Path:
+        return self.cache_dir / "alert_state.json"
+
+    @property
+    def quality_cache_path(self) -> Path:
+        return self.cache_dir / "quality.json"
+
+    @property
+    def feed_path(self) -> Path:
+        return self.cache_dir / "feed.json"
+
 
 DEFAULT_CONFIG = MarketPulseConfig()
@@ -2,61 +2,162 @@
 
 from __future__ import annotations
 
-from datetime import datetime
+from typing import Dict, List, Tuple
 
-from rich.align import Align
 from rich.panel import Panel
 from rich.table import Table
 from rich.text import Text
 from textual.app import App, ComposeResult
+from textual.containers import Vertical
 from textual.widgets import Footer, Header, Static
 
+from marketpulse.alerts import Alert, AlertEngine, AlertSink, StdoutSink
 from marketpulse.config import DEFAULT_CONFIG, MarketPulseConfig
-from marketpulse.engine import build_snapshot
+from marketpulse.engine import build_signal_history, build_snapshot, load_data
+from marketpulse.models import MarketPulseSnapshot
+from marketpulse.sparkline import SparklineCache
 from marketpulse.summary import summary_text
 
+NAME_WIDTH = 22
+VOTE_WIDTH = 8
+DETAIL_WIDTH = 36
+MIN_SPARKLINE_WIDTH = 8
+
+RowState = Tuple[str, str, str]
+
+
+def changed_rows(previous: Dict[str, RowState], current: Dict[str, RowState]) -> Tuple[List[str], List[str]]:
+    """Return (rows to (re)render, rows to remove) between two dashboard states."""
+    changed = [name for name, state in current.items() if previous.get(name) != state]
+    removed = [name for name in previous if name not in current]
+    return changed, removed
+
+
+def _row_grid() -> Table:
+    grid = Table.grid(expand=True, padding=(0, 1))
+    grid.add_column(width=NAME_WIDTH, style="bold", no_wrap=True)
+    grid.add_column(width=VOTE_WIDTH, no_wrap=True)
+    grid.add_column(ratio=1, no_wrap=True)
+    grid.add_column(width=DETAIL_WIDTH, no_wrap=True)
+    return grid
+
+
+def render_row(name: str, state: RowState) -> Table:
+    vote, spark, detail = state
+    grid = _row_grid()
+    grid.add_row(name, vote, spark, detail)
+    return grid
+
+
+class NotifySink(AlertSink):
+    def __init__(self, app: App) -> None:
+        self.app = app
+
+    def deliver(self, alerts: List[Alert]) -> None:
+        for alert in alerts:
+            self.app.notify(alert.message, title="marketPulse alert", severity="warning")
+
+
+def _title(snapshot: MarketPulseSnapshot) -> str:
+    return (
+        f"{snapshot.label.value} {snapshot.score}/100 | VIX {snapshot.extras.get('vix', 'N/A')} | "
+        f"RSP/SPY {snapshot.extras.get('rsp_spy', 'N/A')} | {snapshot.as_of}"
+    )
+
 
 class DashboardApp(App):
     CSS = """
     Screen { layout: vertical; }
-    #content { height: 1fr; }
+    #content { height: 1fr; border: round $primary; }
     #summary { height: auto; }
     """
 
     def __init__(self, config: MarketPulseConfig | None = None) -> None:
         super().__init__()
         self.config = config or DEFAULT_CONFIG
+        self.sparklines = SparklineCache()
+        self._rows: Dict[str, RowState] = {}
+        self._row_widgets: Dict[str, Static] = {}
+        self._title = ""
+        self._summary = ""
+        self._alerts_error = ""
+        self.alerts = self._load_alerts()
 
     def compose(self) -> ComposeResult:
         yield Header()
-        yield Static(id="content")
+        yield Static(id="title")
+        with Vertical(id="content"):
+            yield Static(self._column_header(), id="columns")
         yield Static(id="summary")
         yield Footer()
 
     def on_mount(self) -> None:
+        if self._alerts_error:
+            self.notify(f"Alerts disabled: {self._alerts_error}", title="marketPulse alerts", severity="error")
         self.refresh_snapshot()
         self.set_interval(self.config.refresh_seconds, self.refresh_snapshot)
 
+    def _load_alerts(self) -> AlertEngine | None:
+        if not self.config.alerts_path.exists():
+            return None
+        try:
+            engine = AlertEngine.from_file(self.config.alerts_path, state_path=self.config.alert_state_path)
+        except (OSError, KeyError, TypeError, ValueError) as exc:
+            self._alerts_error = f"{self.config.alerts_path}: {exc}"
+            return None
+        # Printing to stdout would corrupt the terminal UI; show toasts instead.
+        engine.sinks = [sink for sink in engine.sinks if not isinstance(sink, StdoutSink)] + [NotifySink(self)]
+        return engine
+
+    def _column_header(self) -> Table:
+        grid = _row_grid()
+        grid.add_row("Signal", "Vote", "Trend", "Detail", style="dim")
+        return grid
+
+    def _sparkline_width(self) -> int:
+        fixed = NAME_WIDTH + VOTE_WIDTH + DETAIL_WIDTH + 8
+        return max(self.size.width - fixed, MIN_SPARKLINE_WIDTH)
+
     def refresh_snapshot(self) -> None:
-        content = self.query_one("#content", Static)
-        summary = self.query_one("#summary", Static)
+        title = self.query_one("#title", Static)
         try:
-            snapshot = build_snapshot(self.config)
+            bundle = load_data()
+            snapshot = build_snapshot(self.config, bundle)
+            history = build_signal_history(bundle, self.config)
         except Exception as exc:
-            content.update(Panel(f"Error: {exc}", title="marketPulse"))
+            self._title = ""
+            title.update(Panel(f"Error: {exc}", title="marketPulse"))
             return
 
-        table = Table(title="Market Pulse", expand=True, show_lines=True)
-        table.add_column("Signal", style="bold")
-        table.add_column("Vote")
-        table.add_column("Detail")
+        width = self._sparkline_width()
+        rows: Dict[str, RowState] = {}
         for signal in snapshot.signals:
-            table.add_row(signal.name, signal.vote.value, signal.detail)
-
-        header = Text(
-            f"{snapshot.label.value} {snapshot.score}/100 | VIX {snapshot.extras.get('vix', 'N/A')} | RSP/SPY {snapshot.extras.get('rsp_spy', 'N/A')} | {snapshot.as_of}",
-            style="bold",
-        )
-        panel = Panel(Align.left(table), title=header)
-        content.update(panel)
-        summary.update(Panel(summary_text(snapshot), title="Daily Summary", expand=False))
+            series = history.get(signal.name)
+            spark = self.sparklines.get(signal.name, series, width) if series is not None and len(series) else ""
+            rows[signal.name] = (signal.vote.value, spark, signal.detail)
+
+        changed, removed = changed_rows(self._rows, rows)
+        for name in removed:
+            self._row_widgets.pop(name).remove()
+        content = self.query_one("#content", Vertical)
+        for name in changed:
+            widget = self._row_widgets.get(name)
+            if widget is None:
+                widget = Static(render_row(name, rows[name]))
+                self._row_widgets[name] = widget
+                content.mount(widget)
+            else:
+                widget.update(render_row(name, rows[name]))
+        self._rows = rows
+
+        header = _title(snapshot)
+        if header != self._title:
+            self._title = header
+            title.update(Text(header, style="bold"))
+        if self.alerts is not None:
+            self.alerts.evaluate(snapshot)
+
+        summary = summary_text(snapshot)
+        if summary != self._summary:
+            self._summary = summary
+            self.query_one("#summary", Static).update(Panel(summary, title="Daily Summary", expand=False))
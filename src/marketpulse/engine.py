@@ -2,48 +2,140 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Dict, List, Optional
 
 import pandas as pd
 
 from marketpulse.config import DEFAULT_CONFIG, MarketPulseConfig
-from marketpulse.indicators import cumulative, ema, macd, ratio_series, sma, slope, weekly_series
+from marketpulse.indicators import cumulative, ema, macd, sma, slope
+from marketpulse.lookback import LookbackPlan, plan_lookback
 from marketpulse.models import MarketPulseSnapshot, Signal, Vote
+from marketpulse.panel import FILL_ASOF, FILL_NAN, AlignedPanel
 from marketpulse.providers.breadth import BreadthProviderChain
 from marketpulse.providers.market import MarketDataProviderChain
 from marketpulse.providers.vix import VixProviderChain
+from marketpulse.pyramid import TIMEFRAMES, ResamplePyramid, resample_pyramid
+from marketpulse.quality import QualityCache, QualityIssue, validate
+from marketpulse.rolling import rolling_percentile, rolling_zscore
+
+TIMEFRAME_LABELS = {"daily": ("Daily", "D"), "weekly": ("Weekly", "W"), "monthly": ("Monthly", "M")}
+MARKET_SYMBOLS = ("SPY", "RSP")
+MARKET_FIELDS = {"open": FILL_ASOF, "high": FILL_ASOF, "low": FILL_ASOF, "close": FILL_ASOF, "volume": FILL_NAN}
+BREADTH_FIELDS = ("advances", "declines", "new_highs", "new_lows")
+# Order of ``build_signals`` output; the bootstrap in ``robustness`` emits votes
+# in this order too.
+SIGNAL_NAMES = (
+    "Weekly MACD",
+    "8/21 Weekly MA",
+    "8W EMA Slope",
+    "Cum A/D vs 89-EMA",
+    "NHNL Cum vs 10-MA",
+    "NYSI Slope",
+    "VIX Regime",
+    "RSP/SPY Breadth",
+    "VIX 1Y Percentile",
+    "RSP/SPY Z-Score",
+    "Breadth Osc Percentile",
+)
+# Rolling-rank views of inputs that already vote through fixed thresholds; they
+# only count toward the pulse score when ``config.score_rank_signals`` is set.
+RANK_SIGNALS = ("VIX 1Y Percentile", "RSP/SPY Z-Score", "Breadth Osc Percentile")
 
 
 @dataclass
 class DataBundle:
-    spy: pd.DataFrame
-    rsp: pd.DataFrame
-    vix: pd.DataFrame
-    breadth: Optional[pd.DataFrame]
+    """Inputs aligned on the exchange calendar (union of SPY and RSP dates).
+
+    Prices and VIX are filled as-of the last observation; breadth counts are
+    left missing on dates the breadth source skipped.
+    """
+
+    panel: AlignedPanel
+    quality: List[QualityIssue] = field(default_factory=list)
+
+    @classmethod
+    def from_frames(
+        cls,
+        spy: pd.DataFrame,
+        rsp: pd.DataFrame,
+        vix: pd.DataFrame,
+        breadth: Optional[pd.DataFrame] = None,
+        quality: Optional[List[QualityIssue]] = None,
+    ) -> "DataBundle":
+        sources: Dict[str, pd.Series] = {}
+        fill: Dict[str, str] = {}
+        for symbol, frame in zip(MARKET_SYMBOLS, (spy, rsp)):
+            indexed = frame.set_index("date")
+            for column, rule in MARKET_FIELDS.items():
+                if column in indexed.columns:
+                    sources[f"{symbol.lower()}_{column}"] = indexed[column]
+                    fill[f"{symbol.lower()}_{column}"] = rule
+        sources["vix"] = vix.set_index("date")["vix"]
+        fill["vix"] = FILL_ASOF
+        if breadth is not None:
+            indexed = breadth.set_index("date")
+            for column in BREADTH_FIELDS:
+                sources[column] = indexed[column]
+                fill[column] = FILL_NAN
+        calendar = spy["date"].tolist() + rsp["date"].tolist()
+        return cls(panel=AlignedPanel.align(calendar, sources, fill), quality=list(quality or []))
+
+    @property
+    def has_breadth(self) -> bool:
+        return self.panel.has_data("advances")
+
+    def pyramid(self, symbol: str) -> ResamplePyramid:
+        return resample_pyramid(symbol, self.panel.frame(symbol.lower(), MARKET_FIELDS))
+
+
+_QUALITY_CACHE: Optional[QualityCache] = None
+
+
+def _default_quality_cache() -> QualityCache:
+    global _QUALITY_CACHE
+    if _QUALITY_CACHE is None:
+        _QUALITY_CACHE = QualityCache(DEFAULT_CONFIG.quality_cache_path)
+    return _QUALITY_CACHE
 
 
 def load_data(
     market_provider: Optional[MarketDataProviderChain] = None,
     vix_provider: Optional[VixProviderChain] = None,
     breadth_provider: Optional[BreadthProviderChain] = None,
+    plan: Optional[LookbackPlan] = None,
+    quality_cache: Optional[QualityCache] = None,
 ) -> DataBundle:
+    """Fetch and validate inputs, limited to the history in ``plan`` when one is given."""
     market_provider = market_provider or MarketDataProviderChain()
     vix_provider = vix_provider or VixProviderChain()
     breadth_provider = breadth_provider or BreadthProviderChain()
+    quality_cache = quality_cache or _default_quality_cache()
 
-    spy = market_provider.fetch_daily("SPY")
-    rsp = market_provider.fetch_daily("RSP")
-    vix = vix_provider.fetch_daily()
+    def start(series: str) -> Optional[pd.Timestamp]:
+        return plan.start(series) if plan is not None else None
+
+    def trim(series: str, df: pd.DataFrame) -> pd.DataFrame:
+        return plan.trim(series, df) if plan is not None else df
+
+    spy = trim("SPY", market_provider.fetch_daily("SPY", start("SPY")))
+    rsp = trim("RSP", market_provider.fetch_daily("RSP", start("RSP")))
+    vix = trim("VIX", vix_provider.fetch_daily(start("VIX")))
 
     breadth = None
     try:
-        breadth = breadth_provider.fetch_daily()
+        breadth = trim("breadth", breadth_provider.fetch_daily(start("breadth")))
     except Exception:
         breadth = None
 
-    return DataBundle(spy=spy, rsp=rsp, vix=vix, breadth=breadth)
+    quality = validate("ohlcv", "SPY", spy, quality_cache)
+    quality += validate("ohlcv", "RSP", rsp, quality_cache)
+    quality += validate("vix", "VIX", vix, quality_cache)
+    if breadth is not None:
+        quality += validate("breadth", "breadth", breadth, quality_cache)
+
+    return DataBundle.from_frames(spy=spy, rsp=rsp, vix=vix, breadth=breadth, quality=quality)
 
 
 def _vote_from_bool(name: str, condition: bool, value: Optional[float], detail: str) -> Signal:
@@ -54,47 +146,135 @@ def _vote_na(name: str, detail: str) -> Signal:
     return Signal(name=name, vote=Vote.NA, value=None, detail=detail)
 
 
-def build_signals(bundle: DataBundle, config: MarketPulseConfig = DEFAULT_CONFIG) -> List[Signal]:
+def _trend_series(close: pd.Series) -> Dict[str, pd.Series]:
+    macd_line, signal_line = macd(close)
+    return {
+        "macd": macd_line,
+        "signal": signal_line,
+        "ma8": sma(close, 8),
+        "ma21": sma(close, 21),
+        "ema_slope": slope(ema(close, 8), 1),
+    }
+
+
+def breadth_flows(panel: AlignedPanel) -> Dict[str, pd.Series]:
+    """Net advances and net new highs on the dates the breadth source reported."""
+    rows = panel.mask(*BREADTH_FIELDS)
+    dates = panel.dates[rows]
+    return {
+        "ad": pd.Series(panel.array("advances")[rows] - panel.array("declines")[rows], index=dates, name="ad"),
+        "nhnl": pd.Series(panel.array("new_highs")[rows] - panel.array("new_lows")[rows], index=dates, name="nhnl"),
+    }
+
+
+def _breadth_series(panel: AlignedPanel) -> Dict[str, pd.Series]:
+    flows = breadth_flows(panel)
+    ad_daily = flows["ad"]
+    cum_ad = cumulative(ad_daily)
+    nhnl_daily = flows["nhnl"]
+    cum_nhnl = cumulative(nhnl_daily)
+    osc = ema(ad_daily, 19) - ema(ad_daily, 39)
+    return {
+        "cum_ad": cum_ad,
+        "ad_ema89": ema(cum_ad, 89),
+        "cum_nhnl": cum_nhnl,
+        "nhnl_ma10": sma(cum_nhnl, 10),
+        "osc": osc,
+        "nysi": cumulative(osc),
+    }
+
+
+def rsp_spy_ratio(panel: AlignedPanel) -> pd.Series:
+    both = panel.mask("rsp_close", "spy_close")
+    ratio = panel.array("rsp_close")[both] / panel.array("spy_close")[both]
+    return pd.Series(ratio, index=panel.dates[both], name="rsp_spy")
+
+
+def _rank_series(bundle: DataBundle, config: MarketPulseConfig) -> Dict[str, pd.Series]:
+    window = config.rank_window
+    ranks = {
+        "vix_pct": rolling_percentile(bundle.panel.series("vix"), window),
+        "ratio_z": rolling_zscore(rsp_spy_ratio(bundle.panel), window),
+    }
+    if bundle.has_breadth:
+        ranks["osc_pct"] = rolling_percentile(_breadth_series(bundle.panel)["osc"], window)
+    return ranks
+
+
+def _rank_signals(bundle: DataBundle, config: MarketPulseConfig) -> List[Signal]:
+    ranks = _rank_series(bundle, config)
     signals: List[Signal] = []
 
-    spy_weekly = weekly_series(bundle.spy)
-    macd_line, signal_line = macd(spy_weekly)
-    macd_vote = macd_line.iloc[-1] > signal_line.iloc[-1]
-    signals.append(
+    vix_pct = ranks["vix_pct"].iloc[-1]
+    if pd.isna(vix_pct):
+        signals.append(_vote_na("VIX 1Y Percentile", "Insufficient history"))
+    else:
+        if vix_pct < config.vix_pct_bull:
+            vote = Vote.BULL
+        elif vix_pct <= config.vix_pct_neutral:
+            vote = Vote.NEUTRAL
+        else:
+            vote = Vote.BEAR
+        signals.append(Signal("VIX 1Y Percentile", vote, vix_pct, f"Pctl {vix_pct:.0f}"))
+
+    ratio_z = ranks["ratio_z"].iloc[-1]
+    if pd.isna(ratio_z):
+        signals.append(_vote_na("RSP/SPY Z-Score", "Insufficient history"))
+    else:
+        signals.append(_vote_from_bool("RSP/SPY Z-Score", ratio_z > 0, ratio_z, f"Z {ratio_z:+.2f}"))
+
+    if "osc_pct" not in ranks:
+        signals.append(_vote_na("Breadth Osc Percentile", "Breadth unavailable"))
+        return signals
+    osc_pct = ranks["osc_pct"].iloc[-1]
+    if pd.isna(osc_pct):
+        signals.append(_vote_na("Breadth Osc Percentile", "Insufficient history"))
+    else:
+        signals.append(_vote_from_bool("Breadth Osc Percentile", osc_pct > 50, osc_pct, f"Pctl {osc_pct:.0f}"))
+    return signals
+
+
+def _trend_signals(close: pd.Series, timeframe: str) -> List[Signal]:
+    label, abbrev = TIMEFRAME_LABELS[timeframe]
+    series = _trend_series(close)
+    macd_line, signal_line = series["macd"], series["signal"]
+    ma8, ma21, ema_slope = series["ma8"], series["ma21"], series["ema_slope"]
+    return [
         _vote_from_bool(
-            "Weekly MACD",
-            macd_vote,
+            f"{label} MACD",
+            macd_line.iloc[-1] > signal_line.iloc[-1],
             macd_line.iloc[-1],
             f"MACD {macd_line.iloc[-1]:.2f} vs signal {signal_line.iloc[-1]:.2f}",
-        )
-    )
-
-    ma8 = sma(spy_weekly, 8)
-    ma21 = sma(spy_weekly, 21)
-    signals.append(
+        ),
         _vote_from_bool(
-            "8/21 Weekly MA",
+            f"8/21 {label} MA",
             ma8.iloc[-1] > ma21.iloc[-1],
             ma8.iloc[-1] - ma21.iloc[-1],
-            f"8W {ma8.iloc[-1]:.2f} vs 21W {ma21.iloc[-1]:.2f}",
-        )
-    )
-
-    ema8 = ema(spy_weekly, 8)
-    ema_slope = slope(ema8, 1)
-    signals.append(
+            f"8{abbrev} {ma8.iloc[-1]:.2f} vs 21{abbrev} {ma21.iloc[-1]:.2f}",
+        ),
         _vote_from_bool(
-            "8W EMA Slope",
+            f"8{abbrev} EMA Slope",
             ema_slope.iloc[-1] > 0,
             ema_slope.iloc[-1],
             f"Slope {ema_slope.iloc[-1]:.2f}",
-        )
-    )
+        ),
+    ]
+
+
+def build_timeframe_signals(bundle: DataBundle) -> Dict[str, List[Signal]]:
+    pyramid = bundle.pyramid("SPY")
+    return {timeframe: _trend_signals(pyramid.close(timeframe), timeframe) for timeframe in TIMEFRAMES}
+
 
-    if bundle.breadth is not None:
-        ad_daily = bundle.breadth["advances"] - bundle.breadth["declines"]
-        cum_ad = cumulative(ad_daily)
-        ad_ema89 = ema(cum_ad, 89)
+def build_signals(bundle: DataBundle, config: MarketPulseConfig = DEFAULT_CONFIG) -> List[Signal]:
+    signals: List[Signal] = []
+
+    spy_weekly = bundle.pyramid("SPY").close("weekly")
+    signals.extend(_trend_signals(spy_weekly, "weekly"))
+
+    if bundle.has_breadth:
+        breadth = _breadth_series(bundle.panel)
+        cum_ad, ad_ema89 = breadth["cum_ad"], breadth["ad_ema89"]
         signals.append(
             _vote_from_bool(
                 "Cum A/D vs 89-EMA",
@@ -104,9 +284,7 @@ def build_signals(bundle: DataBundle, config: MarketPulseConfig = DEFAULT_CONFIG
             )
         )
 
-        nhnl_daily = bundle.breadth["new_highs"] - bundle.breadth["new_lows"]
-        cum_nhnl = cumulative(nhnl_daily)
-        nhnl_ma10 = sma(cum_nhnl, 10)
+        cum_nhnl, nhnl_ma10 = breadth["cum_nhnl"], breadth["nhnl_ma10"]
         signals.append(
             _vote_from_bool(
                 "NHNL Cum vs 10-MA",
@@ -116,8 +294,7 @@ def build_signals(bundle: DataBundle, config: MarketPulseConfig = DEFAULT_CONFIG
             )
         )
 
-        osc = ema(ad_daily, 19) - ema(ad_daily, 39)
-        nysi = cumulative(osc)
+        nysi = breadth["nysi"]
         nysi_slope = nysi.iloc[-1] - nysi.iloc[-6] if len(nysi) > 6 else nysi.diff().iloc[-1]
         signals.append(
             _vote_from_bool(
@@ -132,7 +309,7 @@ def build_signals(bundle: DataBundle, config: MarketPulseConfig = DEFAULT_CONFIG
         signals.append(_vote_na("NHNL Cum vs 10-MA", "Breadth unavailable"))
         signals.append(_vote_na("NYSI Slope", "Breadth unavailable"))
 
-    vix_latest = bundle.vix["vix"].iloc[-1]
+    vix_latest = bundle.panel.last("vix")
     if vix_latest < config.vix_bull:
         vix_vote = Vote.BULL
     elif vix_latest <= config.vix_neutral:
@@ -148,9 +325,7 @@ def build_signals(bundle: DataBundle, config: MarketPulseConfig = DEFAULT_CONFIG
         )
     )
 
-    rsp_close = bundle.rsp.set_index("date")["close"]
-    spy_close = bundle.spy.set_index("date")["close"]
-    ratio = ratio_series(rsp_close, spy_close)
+    ratio = rsp_spy_ratio(bundle.panel)
     ratio_sma = sma(ratio, 50)
     ratio_slope = slope(ratio, 1)
     signals.append(
@@ -162,10 +337,39 @@ def build_signals(bundle: DataBundle, config: MarketPulseConfig = DEFAULT_CONFIG
         )
     )
 
+    signals.extend(_rank_signals(bundle, config))
     return signals
 
 
+def build_signal_history(bundle: DataBundle, config: MarketPulseConfig = DEFAULT_CONFIG) -> Dict[str, pd.Series]:
+    """Return the series behind each signal's ``value``, keyed by signal name."""
+    trend = _trend_series(bundle.pyramid("SPY").close("weekly"))
+    history = {
+        "Weekly MACD": trend["macd"],
+        "8/21 Weekly MA": trend["ma8"] - trend["ma21"],
+        "8W EMA Slope": trend["ema_slope"],
+    }
+    if bundle.has_breadth:
+        breadth = _breadth_series(bundle.panel)
+        history["Cum A/D vs 89-EMA"] = breadth["cum_ad"] - breadth["ad_ema89"]
+        history["NHNL Cum vs 10-MA"] = breadth["cum_nhnl"] - breadth["nhnl_ma10"]
+        history["NYSI Slope"] = breadth["nysi"].diff(5)
+    history["VIX Regime"] = bundle.panel.series("vix")
+    history["RSP/SPY Breadth"] = rsp_spy_ratio(bundle.panel)
+    ranks = _rank_series(bundle, config)
+    history["VIX 1Y Percentile"] = ranks["vix_pct"]
+    history["RSP/SPY Z-Score"] = ranks["ratio_z"]
+    if "osc_pct" in ranks:
+        history["Breadth Osc Percentile"] = ranks["osc_pct"]
+    return history
+
+
+def is_scored(name: str, config: MarketPulseConfig = DEFAULT_CONFIG) -> bool:
+    return config.score_rank_signals or name not in RANK_SIGNALS
+
+
 def score_signals(signals: List[Signal], config: MarketPulseConfig = DEFAULT_CONFIG) -> tuple[int, Vote]:
+    signals = [signal for signal in signals if is_scored(signal.name, config)]
     score_map = {Vote.BULL: 1, Vote.BEAR: -1, Vote.NEUTRAL: 0, Vote.NA: 0}
     raw = sum(score_map[signal.vote] for signal in signals)
     max_score = max(len(signals), 1)
@@ -179,6 +383,15 @@ def score_signals(signals: List[Signal], config: MarketPulseConfig = DEFAULT_CON
     return normalized, label
 
 
+def score_timeframes(
+    timeframe_signals: Dict[str, List[Signal]], config: MarketPulseConfig = DEFAULT_CONFIG
+) -> Dict[str, int]:
+    scores = {timeframe: score_signals(signals, config)[0] for timeframe, signals in timeframe_signals.items()}
+    combined = [signal for signals in timeframe_signals.values() for signal in signals]
+    scores["combined"] = score_signals(combined, config)[0]
+    return scores
+
+
 def detect_conflicts(signals: List[Signal]) -> List[str]:
     conflicts: List[str] = []
     trend_votes = [s.vote for s in signals if s.name in {"Weekly MACD", "8/21 Weekly MA", "8W EMA Slope"}]
@@ -191,14 +404,28 @@ def detect_conflicts(signals: List[Signal]) -> List[str]:
     return conflicts
 
 
-def build_snapshot(config: MarketPulseConfig = DEFAULT_CONFIG) -> MarketPulseSnapshot:
-    bundle = load_data()
+def build_snapshot(
+    config: MarketPulseConfig = DEFAULT_CONFIG, bundle: Optional[DataBundle] = None
+) -> MarketPulseSnapshot:
+    bundle = bundle or load_data(plan=plan_lookback(config))
     signals = build_signals(bundle, config)
     score, label = score_signals(signals, config)
+    timeframe_scores = score_timeframes(build_timeframe_signals(bundle), config)
     conflicts = detect_conflicts(signals)
-    as_of = max(bundle.spy["date"].iloc[-1], bundle.vix["date"].iloc[-1]).strftime("%Y-%m-%d")
+    panel = bundle.panel
+    as_of = max(panel.last_observed_date("spy_close"), panel.last_observed_date("vix")).strftime("%Y-%m-%d")
     extras = {
-        "vix": f"{bundle.vix['vix'].iloc[-1]:.2f}",
-        "rsp_spy": f"{(bundle.rsp['close'].iloc[-1] / bundle.spy['close'].iloc[-1]):.4f}",
+        "vix": f"{panel.last('vix'):.2f}",
+        "rsp_spy": f"{(panel.last('rsp_close') / panel.last('spy_close')):.4f}",
+        "mtf": " | ".join(f"{TIMEFRAME_LABELS[tf][1]} {timeframe_scores[tf]}" for tf in TIMEFRAMES),
+        "mtf_score": str(timeframe_scores["combined"]),
     }
-    return MarketPulseSnapshot(as_of=as_of, score=score, label=label, signals=signals, conflicts=conflicts, extras=extras)
+    return MarketPulseSnapshot(
+        as_of=as_of,
+        score=score,
+        label=label,
+        signals=signals,
+        conflicts=conflicts,
+        extras=extras,
+        quality=[str(issue) for issue in bundle.quality],
+    )
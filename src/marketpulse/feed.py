@@ -0,0 +1,236 @@
+"""Versioned snapshot feed with field-level deltas."""
+
+from __future__ import annotations
+
+import math
+import struct
+from collections import deque
+from dataclasses import asdict
+from enum import Enum
+from pathlib import Path
+from typing import Any, Deque, Dict, List, Optional, Tuple
+
+from marketpulse.models import MarketPulseSnapshot
+from marketpulse.utils import read_json_or_none, write_json_atomic
+
+Fields = Dict[str, Any]
+
+MAGIC = b"MPF1"
+
+
+def _plain(value: Any) -> Any:
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, list):
+        return [_plain(item) for item in value]
+    if isinstance(value, dict):
+        return {key: _plain(item) for key, item in value.items()}
+    if isinstance(value, float):
+        # NaN never compares equal (every publish would look like a change)
+        # and is not valid JSON, so non-finite values travel as null.
+        return float(value) if math.isfinite(value) else None
+    return value
+
+
+def _flatten(prefix: str, value: Any, out: Fields) -> None:
+    if isinstance(value, dict) and value:
+        for key, item in value.items():
+            _flatten(f"{prefix}.{key}" if prefix else str(key), item, out)
+    else:
+        out[prefix] = value
+
+
+def snapshot_fields(snapshot: MarketPulseSnapshot) -> Fields:
+    """Flatten a snapshot to dotted paths; signals are keyed by name."""
+    data = _plain(asdict(snapshot))
+    signals = data.pop("signals")
+    data["signal_order"] = [signal["name"] for signal in signals]
+    data["signals"] = {
+        signal["name"]: {"vote": signal["vote"], "value": signal["value"], "detail": signal["detail"]}
+        for signal in signals
+    }
+    out: Fields = {}
+    _flatten("", data, out)
+    return out
+
+
+def diff_fields(previous: Fields, current: Fields) -> Tuple[Fields, List[str]]:
+    changed = {key: value for key, value in current.items() if key not in previous or previous[key] != value}
+    removed = [key for key in previous if key not in current]
+    return changed, removed
+
+
+def apply_message(fields: Fields, message: Dict[str, Any]) -> Fields:
+    """Client side: bring ``fields`` up to date with a ``changes_since`` message."""
+    if "full" in message:
+        return dict(message["full"])
+    updated = dict(fields)
+    for key in message.get("del", []):
+        updated.pop(key, None)
+    updated.update(message.get("set", {}))
+    return updated
+
+
+class SnapshotFeed:
+    """Sequence-numbered snapshots kept as a bounded log of deltas.
+
+    Each published snapshot that differs from the last one gets the next
+    sequence number. ``changes_since(n)`` returns one merged delta when ``n``
+    is still covered by the log and the full field set otherwise.
+    """
+
+    def __init__(self, capacity: int = 512, path: Optional[Path] = None) -> None:
+        self.capacity = capacity
+        self.path = path
+        self.seq = 0
+        self.fields: Fields = {}
+        self.deltas: Deque[Tuple[int, Fields, List[str]]] = deque(maxlen=capacity)
+        if path is not None and path.exists():
+            self._load(path)
+
+    def publish(self, snapshot: MarketPulseSnapshot) -> int:
+        current = snapshot_fields(snapshot)
+        changed, removed = diff_fields(self.fields, current)
+        if changed or removed or self.seq == 0:
+            self.seq += 1
+            self.deltas.append((self.seq, changed, removed))
+            self.fields = current
+            self.save()
+        return self.seq
+
+    def changes_since(self, since: int) -> Dict[str, Any]:
+        oldest_base = self.deltas[0][0] - 1 if self.deltas else self.seq
+        if since <= 0 or since > self.seq or since < oldest_base:
+            return {"seq": self.seq, "full": self.fields}
+        merged: Fields = {}
+        removed: Dict[str, None] = {}
+        for seq, changed, dropped in self.deltas:
+            if seq <= since:
+                continue
+            for key in dropped:
+                merged.pop(key, None)
+                removed[key] = None
+            for key, value in changed.items():
+                merged[key] = value
+                removed.pop(key, None)
+        message: Dict[str, Any] = {"seq": self.seq, "base": since, "set": merged}
+        if removed:
+            message["del"] = list(removed)
+        return message
+
+    def _load(self, path: Path) -> None:
+        """Restore the log; an unreadable file restarts at seq 0 so clients get a full message."""
+        data = read_json_or_none(path)
+        try:
+            seq, fields = int(data["seq"]), dict(data["fields"])
+            deltas = [(int(number), dict(changed), list(removed)) for number, changed, removed in data["deltas"]]
+        except (KeyError, TypeError, ValueError):
+            return
+        self.seq, self.fields = seq, fields
+        self.deltas.extend(deltas)
+
+    def save(self) -> None:
+        if self.path is None:
+            return
+        write_json_atomic(self.path, {"seq": self.seq, "fields": self.fields, "deltas": list(self.deltas)})
+
+
+def _varint(value: int, out: bytearray) -> None:
+    while True:
+        byte = value & 0x7F
+        value >>= 7
+        if value:
+            out.append(byte | 0x80)
+        else:
+            out.append(byte)
+            return
+
+
+def _encode(value: Any, out: bytearray) -> None:
+    if value is None:
+        out += b"N"
+    elif value is True:
+        out += b"T"
+    elif value is False:
+        out += b"F"
+    elif isinstance(value, int):
+        out += b"i"
+        _varint((value << 1) ^ (value >> 63), out)
+    elif isinstance(value, float):
+        out += b"d" + struct.pack("<d", value)
+    elif isinstance(value, str):
+        raw = value.encode("utf-8")
+        out += b"s"
+        _varint(len(raw), out)
+        out += raw
+    elif isinstance(value, (list, tuple)):
+        out += b"l"
+        _varint(len(value), out)
+        for item in value:
+            _encode(item, out)
+    elif isinstance(value, dict):
+        out += b"m"
+        _varint(len(value), out)
+        for key, item in value.items():
+            _encode(str(key), out)
+            _encode(item, out)
+    else:
+        raise TypeError(f"Cannot encode {type(value).__name__}")
+
+
+def encode_binary(message: Dict[str, Any]) -> bytes:
+    """Compact tagged encoding: varint ints and lengths, little-endian doubles."""
+    out = bytearray(MAGIC)
+    _encode(message, out)
+    return bytes(out)
+
+
+class _Reader:
+    def __init__(self, data: bytes) -> None:
+        self.data = data
+        self.pos = 0
+
+    def take(self, count: int) -> bytes:
+        chunk = self.data[self.pos : self.pos + count]
+        if len(chunk) != count:
+            raise ValueError("Truncated feed message")
+        self.pos += count
+        return chunk
+
+    def varint(self) -> int:
+        result = shift = 0
+        while True:
+            byte = self.take(1)[0]
+            result |= (byte & 0x7F) << shift
+            if not byte & 0x80:
+                return result
+            shift += 7
+
+    def value(self) -> Any:
+        tag = self.take(1)
+        if tag == b"N":
+            return None
+        if tag == b"T":
+            return True
+        if tag == b"F":
+            return False
+        if tag == b"i":
+            raw = self.varint()
+            return (raw >> 1) ^ -(raw & 1)
+        if tag == b"d":
+            return struct.unpack("<d", self.take(8))[0]
+        if tag == b"s":
+            return self.take(self.varint()).decode("utf-8")
+        if tag == b"l":
+            return [self.value() for _ in range(self.varint())]
+        if tag == b"m":
+            return {self.value(): self.value() for _ in range(self.varint())}
+        raise ValueError(f"Unknown feed tag: {tag!r}")
+
+
+def decode_binary(data: bytes) -> Dict[str, Any]:
+    if not data.startswith(MAGIC):
+        raise ValueError("Not a marketPulse feed message")
+    reader = _Reader(data)
+    reader.pos = len(MAGIC)
+    return reader.value()
@@ -0,0 +1,98 @@
+"""Plan the minimal history each input series needs."""
+
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass
+from datetime import date, timedelta
+from typing import Dict, Optional
+
+import pandas as pd
+
+from marketpulse.config import DEFAULT_CONFIG, MarketPulseConfig
+from marketpulse.utils import trim_history
+
+TRADING_DAYS_PER_BAR = {"daily": 1, "weekly": 5, "monthly": 21}
+TRADING_DAYS_PER_YEAR = 252
+CALENDAR_DAYS_PER_YEAR = 365.25
+# Room for exchange holidays and a partially formed first bucket.
+SAFETY_DAYS = 14
+SAFETY_BARS = 10
+
+
+def ema_warmup(span: int, tolerance: float) -> int:
+    """Bars after which the seed of an ``adjust=False`` EMA weighs less than ``tolerance``."""
+    alpha = 2.0 / (span + 1.0)
+    return int(math.ceil(math.log(tolerance) / math.log(1.0 - alpha)))
+
+
+def _scaled(span: int, scale: float) -> int:
+    return int(math.ceil(span * scale))
+
+
+def trend_bars(tolerance: float, scale: float = 1.0) -> int:
+    """Bars needed by MACD 12/26/9, the 8/21 SMA cross and the 8-EMA slope.
+
+    ``scale`` stretches every span and window, e.g. for jittered indicator
+    lengths in the bootstrap band.
+    """
+    macd_bars = ema_warmup(_scaled(26, scale), tolerance) + ema_warmup(_scaled(9, scale), tolerance)
+    return max(macd_bars, _scaled(21, scale), ema_warmup(_scaled(8, scale), tolerance) + 1)
+
+
+def breadth_bars(tolerance: float, scale: float = 1.0) -> int:
+    """Daily bars for Cum A/D vs 89-EMA, NHNL vs 10-MA and the NYSI slope.
+
+    The cumulative lines are offset-invariant in every comparison, so only the
+    EMA warm-up and window lengths matter.
+    """
+    return max(
+        ema_warmup(_scaled(89, scale), tolerance) + 1,
+        _scaled(10, scale),
+        ema_warmup(_scaled(39, scale), tolerance) + 5,
+    )
+
+
+def oscillator_bars(tolerance: float, window: int, scale: float = 1.0) -> int:
+    """Daily bars for a rolling percentile of the 19/39 breadth oscillator."""
+    return ema_warmup(_scaled(39, scale), tolerance) + window
+
+
+@dataclass(frozen=True)
+class LookbackPlan:
+    """Trading days required per input series.
+
+    ``start`` is only a hint for how much to request from a network source;
+    ``trim`` counts rows back from the series' own last row, so a source that
+    lags the calendar (e.g. a stale local CSV) still keeps the planned history.
+    """
+
+    bars: Dict[str, int]
+    tolerance: float
+
+    def start(self, series: str, end: Optional[date] = None) -> pd.Timestamp:
+        end = end or date.today()
+        days = math.ceil(self.bars[series] * CALENDAR_DAYS_PER_YEAR / TRADING_DAYS_PER_YEAR) + SAFETY_DAYS
+        return pd.Timestamp(end - timedelta(days=days))
+
+    def rows(self, series: str) -> int:
+        return self.bars[series] + SAFETY_BARS
+
+    def trim(self, series: str, df: pd.DataFrame) -> pd.DataFrame:
+        return trim_history(df, self.rows(series))
+
+
+def plan_lookback(config: MarketPulseConfig = DEFAULT_CONFIG, robust: bool = False) -> LookbackPlan:
+    """History per series; ``robust`` covers spans inflated by ``robust_window_jitter``."""
+    tolerance = config.lookback_tolerance
+    scale = 1.0 + config.robust_window_jitter if robust else 1.0
+    spy = (trend_bars(tolerance, scale) + 1) * max(TRADING_DAYS_PER_BAR.values())
+    window = config.rank_window
+    rsp = max(_scaled(50, scale) + 1, window)
+    bars = {
+        "SPY": max(spy, rsp),
+        "RSP": rsp,
+        "VIX": window,
+        "breadth": max(breadth_bars(tolerance, scale), oscillator_bars(tolerance, window, scale)),
+    }
+    return LookbackPlan(bars=bars, tolerance=tolerance)
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from enum import Enum
 from typing import Dict, List, Optional
 
@@ -22,6 +22,15 @@ class Signal:
     detail: str
 
 
+@dataclass(frozen=True)
+class ScoreBand:
+    samples: int
+    low: int
+    median: int
+    high: int
+    label_odds: Dict[str, float] = field(default_factory=dict)
+
+
 @dataclass(frozen=True)
 class MarketPulseSnapshot:
     as_of: str
@@ -30,3 +39,5 @@ class MarketPulseSnapshot:
     signals: List[Signal]
     conflicts: List[str]
     extras: Dict[str, str]
+    band: Optional[ScoreBand] = None
+    quality: List[str] = field(default_factory=list)
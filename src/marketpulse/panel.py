@@ -0,0 +1,133 @@
+"""Series aligned on a shared trading-date index."""
+
+from __future__ import annotations
+
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+# Fill rules for calendar dates a source did not observe.
+FILL_ASOF = "asof"  # last observation on or before the date (levels: prices, VIX)
+FILL_ZERO = "zero"  # zero (flows where a skipped date means no activity)
+FILL_NAN = "nan"  # leave missing
+FILL_RULES = (FILL_ASOF, FILL_ZERO, FILL_NAN)
+
+
+def trading_dates(values: Iterable) -> pd.DatetimeIndex:
+    dates = pd.DatetimeIndex(pd.to_datetime(pd.Index(values)))
+    if dates.tz is not None:
+        dates = dates.tz_localize(None)
+    return dates.normalize()
+
+
+class AlignedPanel:
+    """Float fields on one trading-date index with explicit missing-data masks.
+
+    Each field is a C-contiguous row of ``values`` with a matching row of
+    ``observed`` marking dates the source actually reported. Dates the source
+    skipped are filled according to the field's rule. ``series`` hands out
+    read-only views, so signals never copy or realign the underlying data.
+    """
+
+    def __init__(
+        self,
+        dates: pd.DatetimeIndex,
+        fields: List[str],
+        values: np.ndarray,
+        observed: np.ndarray,
+        fill: Dict[str, str],
+    ) -> None:
+        self.dates = dates
+        self.fields = list(fields)
+        self.values = values
+        self.observed = observed
+        self.fill = dict(fill)
+        self._rows = {field: row for row, field in enumerate(self.fields)}
+        self.values.setflags(write=False)
+        self.observed.setflags(write=False)
+
+    @classmethod
+    def align(
+        cls,
+        calendar: Iterable,
+        sources: Dict[str, pd.Series],
+        fill: Dict[str, str],
+    ) -> "AlignedPanel":
+        """Align date-indexed ``sources`` onto ``calendar`` using each field's fill rule."""
+        dates = trading_dates(calendar).unique().sort_values()
+        fields = list(sources)
+        values = np.full((len(fields), len(dates)), np.nan)
+        observed = np.zeros((len(fields), len(dates)), dtype=bool)
+        for row, field in enumerate(fields):
+            rule = fill.get(field, FILL_NAN)
+            if rule not in FILL_RULES:
+                raise ValueError(f"Unknown fill rule for {field}: {rule}")
+            source = sources[field].dropna()
+            source.index = trading_dates(source.index)
+            source = source[~source.index.duplicated(keep="last")].sort_index()
+            src_values = source.to_numpy(dtype=float)
+
+            exact = source.index.get_indexer(dates)
+            observed[row] = exact >= 0
+            if rule == FILL_ASOF:
+                prior = source.index.searchsorted(dates, side="right") - 1
+                has_prior = prior >= 0
+                values[row, has_prior] = src_values[prior[has_prior]]
+            else:
+                values[row, observed[row]] = src_values[exact[observed[row]]]
+                if rule == FILL_ZERO:
+                    values[row, ~observed[row]] = 0.0
+        return cls(dates=dates, fields=fields, values=values, observed=observed, fill=fill)
+
+    def __contains__(self, field: str) -> bool:
+        return field in self._rows
+
+    def __len__(self) -> int:
+        return len(self.dates)
+
+    def has_data(self, field: str) -> bool:
+        return field in self._rows and bool(self.observed[self._rows[field]].any())
+
+    def span(self, field: str) -> Tuple[int, int]:
+        """Index range from the first observation to the last meaningful row.
+
+        As-of fields stay valid after their last observation; other fields end
+        at it so a lagging source does not contribute filled rows at the tail.
+        """
+        hits = np.flatnonzero(self.observed[self._rows[field]])
+        if len(hits) == 0:
+            return 0, 0
+        end = len(self.dates) if self.fill.get(field) == FILL_ASOF else hits[-1] + 1
+        return int(hits[0]), int(end)
+
+    def array(self, field: str) -> np.ndarray:
+        return self.values[self._rows[field]]
+
+    def mask(self, *fields: str) -> np.ndarray:
+        """Dates on which every one of ``fields`` was observed."""
+        return np.logical_and.reduce([self.observed[self._rows[field]] for field in fields])
+
+    def series(self, field: str) -> pd.Series:
+        start, end = self.span(field)
+        return pd.Series(self.array(field)[start:end], index=self.dates[start:end], name=field, copy=False)
+
+    def last(self, field: str) -> float:
+        """Latest meaningful value, or NaN when ``field`` was never observed."""
+        start, end = self.span(field)
+        if end == start:
+            return float("nan")
+        return float(self.array(field)[end - 1])
+
+    def last_observed_date(self, field: str) -> Optional[pd.Timestamp]:
+        hits = np.flatnonzero(self.observed[self._rows[field]])
+        return self.dates[hits[-1]] if len(hits) else None
+
+    def frame(self, prefix: str, columns: Iterable[str]) -> pd.DataFrame:
+        """Rows where ``{prefix}_close`` was observed, as a frame with a ``date`` column."""
+        present = [col for col in columns if f"{prefix}_{col}" in self]
+        rows = self.mask(f"{prefix}_close")
+        data = {"date": self.dates[rows]}
+        for col in present:
+            data[col] = self.array(f"{prefix}_{col}")[rows]
+        return pd.DataFrame(data)
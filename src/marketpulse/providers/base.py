@@ -10,19 +10,19 @@ import pandas as pd
 
 class MarketDataProvider(ABC):
     @abstractmethod
-    def fetch_daily(self, symbol: str) -> pd.DataFrame:
+    def fetch_daily(self, symbol: str, start: Optional[pd.Timestamp] = None) -> pd.DataFrame:
         raise NotImplementedError
 
 
 class VixDataProvider(ABC):
     @abstractmethod
-    def fetch_daily(self) -> pd.DataFrame:
+    def fetch_daily(self, start: Optional[pd.Timestamp] = None) -> pd.DataFrame:
         raise NotImplementedError
 
 
 class BreadthDataProvider(ABC):
     @abstractmethod
-    def fetch_daily(self) -> pd.DataFrame:
+    def fetch_daily(self, start: Optional[pd.Timestamp] = None) -> pd.DataFrame:
         raise NotImplementedError
 
 
@@ -16,7 +16,7 @@ class LocalCsvBreadthProvider(BreadthDataProvider):
     def __init__(self, data_dir: Optional[Path] = None) -> None:
         self.data_dir = data_dir or DEFAULT_CONFIG.data_dir
 
-    def fetch_daily(self) -> pd.DataFrame:
+    def fetch_daily(self, start: Optional[pd.Timestamp] = None) -> pd.DataFrame:
         path = self.data_dir / "breadth.csv"
         if not path.exists():
             raise FileNotFoundError(f"Missing local CSV: {path}")
@@ -29,10 +29,10 @@ class BreadthProviderChain(ProviderChain, BreadthDataProvider):
         super().__init__(label="Breadth data")
         self.providers = providers or [LocalCsvBreadthProvider()]
 
-    def fetch_daily(self) -> pd.DataFrame:
+    def fetch_daily(self, start: Optional[pd.Timestamp] = None) -> pd.DataFrame:
         for provider in self.providers:
             try:
-                data = provider.fetch_daily()
+                data = provider.fetch_daily(start)
                 if not data.empty:
                     return data
             except Exception as exc:  # pragma: no cover
@@ -18,7 +18,7 @@ class LocalCsvMarketProvider(MarketDataProvider):
     def __init__(self, data_dir: Optional[Path] = None) -> None:
         self.data_dir = data_dir or DEFAULT_CONFIG.data_dir
 
-    def fetch_daily(self, symbol: str) -> pd.DataFrame:
+    def fetch_daily(self, symbol: str, start: Optional[pd.Timestamp] = None) -> pd.DataFrame:
         path = self.data_dir / f"{symbol.upper()}.csv"
         if not path.exists():
             raise FileNotFoundError(f"Missing local CSV: {path}")
@@ -27,9 +27,11 @@ class LocalCsvMarketProvider(MarketDataProvider):
 
 
 class StooqMarketProvider(MarketDataProvider):
-    def fetch_daily(self, symbol: str) -> pd.DataFrame:
+    def fetch_daily(self, symbol: str, start: Optional[pd.Timestamp] = None) -> pd.DataFrame:
         ticker = f"{symbol.lower()}.us"
         url = f"https://stooq.com/q/d/l/?s={ticker}&i=d"
+        if start is not None:
+            url += f"&d1={start:%Y%m%d}&d2={pd.Timestamp.today():%Y%m%d}"
         response = requests.get(url, timeout=15)
         response.raise_for_status()
         df = pd.read_csv(StringIO(response.text))
@@ -37,13 +39,16 @@ class StooqMarketProvider(MarketDataProvider):
 
 
 class YFinanceMarketProvider(MarketDataProvider):
-    def fetch_daily(self, symbol: str) -> pd.DataFrame:
+    def fetch_daily(self, symbol: str, start: Optional[pd.Timestamp] = None) -> pd.DataFrame:
         try:
             import yfinance as yf
         except ImportError as exc:  # pragma: no cover - optional dependency
             raise ImportError("yfinance is required for this provider") from exc
         ticker = yf.Ticker(symbol)
-        hist = ticker.history(period="max", interval="1d")
+        if start is None:
+            hist = ticker.history(period="max", interval="1d")
+        else:
+            hist = ticker.history(start=start.strftime("%Y-%m-%d"), interval="1d")
         if hist.empty:
             raise ValueError("No data returned from yfinance")
         hist = hist.reset_index()
@@ -67,10 +72,10 @@ class MarketDataProviderChain(ProviderChain, MarketDataProvider):
             YFinanceMarketProvider(),
         ]
 
-    def fetch_daily(self, symbol: str) -> pd.DataFrame:
+    def fetch_daily(self, symbol: str, start: Optional[pd.Timestamp] = None) -> pd.DataFrame:
         for provider in self.providers:
             try:
-                data = provider.fetch_daily(symbol)
+                data = provider.fetch_daily(symbol, start)
                 if not data.empty:
                     return data
             except Exception as exc:  # pragma: no cover - exercised via chain logic
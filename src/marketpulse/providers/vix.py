@@ -18,7 +18,7 @@ class LocalCsvVixProvider(VixDataProvider):
     def __init__(self, data_dir: Optional[Path] = None) -> None:
         self.data_dir = data_dir or DEFAULT_CONFIG.data_dir
 
-    def fetch_daily(self) -> pd.DataFrame:
+    def fetch_daily(self, start: Optional[pd.Timestamp] = None) -> pd.DataFrame:
         path = self.data_dir / "VIX.csv"
         if not path.exists():
             raise FileNotFoundError(f"Missing local CSV: {path}")
@@ -27,8 +27,10 @@ class LocalCsvVixProvider(VixDataProvider):
 
 
 class FredVixProvider(VixDataProvider):
-    def fetch_daily(self) -> pd.DataFrame:
+    def fetch_daily(self, start: Optional[pd.Timestamp] = None) -> pd.DataFrame:
         url = "https://fred.stlouisfed.org/graph/fredgraph.csv?id=VIXCLS"
+        if start is not None:
+            url += f"&cosd={start:%Y-%m-%d}"
         response = requests.get(url, timeout=15)
         response.raise_for_status()
         df = pd.read_csv(StringIO(response.text))
@@ -44,10 +46,10 @@ class VixProviderChain(ProviderChain, VixDataProvider):
         super().__init__(label="VIX data")
         self.providers = providers or [LocalCsvVixProvider(), FredVixProvider()]
 
-    def fetch_daily(self) -> pd.DataFrame:
+    def fetch_daily(self, start: Optional[pd.Timestamp] = None) -> pd.DataFrame:
         for provider in self.providers:
             try:
-                data = provider.fetch_daily()
+                data = provider.fetch_daily(start)
                 if not data.empty:
                     return data
             except Exception as exc:  # pragma: no cover
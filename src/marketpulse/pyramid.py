@@ -0,0 +1,108 @@
+"""Multi-timeframe OHLC resample pyramid."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Dict
+
+import pandas as pd
+from pandas.tseries.frequencies import to_offset
+
+OHLC_AGG = {"open": "first", "high": "max", "low": "min", "close": "last", "volume": "sum"}
+TIMEFRAME_RULES = {
+    "weekly": to_offset("W-FRI"),
+    "monthly": pd.offsets.MonthEnd(),
+}
+TIMEFRAMES = ("daily", "weekly", "monthly")
+
+
+def resample_ohlc(daily: pd.DataFrame, rule: pd.DateOffset) -> pd.DataFrame:
+    agg = {col: how for col, how in OHLC_AGG.items() if col in daily.columns}
+    return daily.resample(rule).agg(agg).dropna(subset=["close"])
+
+
+def _daily_frame(df: pd.DataFrame) -> pd.DataFrame:
+    columns = [col for col in OHLC_AGG if col in df.columns]
+    return df.set_index("date")[columns]
+
+
+@dataclass
+class ResamplePyramid:
+    """Daily bars with their weekly (W-FRI) and monthly OHLC aggregates.
+
+    Monthly bars are aggregated from the daily level so that weeks spanning a
+    month boundary are split correctly.
+    """
+
+    daily: pd.DataFrame
+    weekly: pd.DataFrame
+    monthly: pd.DataFrame
+
+    @classmethod
+    def build(cls, df: pd.DataFrame) -> "ResamplePyramid":
+        daily = _daily_frame(df)
+        return cls(
+            daily=daily,
+            weekly=resample_ohlc(daily, TIMEFRAME_RULES["weekly"]),
+            monthly=resample_ohlc(daily, TIMEFRAME_RULES["monthly"]),
+        )
+
+    def frame(self, timeframe: str) -> pd.DataFrame:
+        if timeframe not in TIMEFRAMES:
+            raise ValueError(f"Unknown timeframe: {timeframe}")
+        return getattr(self, timeframe)
+
+    def close(self, timeframe: str) -> pd.Series:
+        return self.frame(timeframe)["close"]
+
+    def update(self, df: pd.DataFrame) -> "ResamplePyramid":
+        """Return a pyramid for ``df``, re-aggregating only the buckets touched by new bars.
+
+        The incremental path is taken only when every cached bar before the last
+        one is unchanged; the last bar may be revised in place. Restated history
+        (e.g. dividend-adjusted closes) or anything else triggers a full rebuild.
+        """
+        incoming = _daily_frame(df)
+        if incoming.equals(self.daily):
+            return self
+        cached = len(self.daily)
+        if (
+            cached == 0
+            or len(incoming) < cached
+            or incoming.index[cached - 1] != self.daily.index[-1]
+            or not incoming.iloc[: cached - 1].equals(self.daily.iloc[: cached - 1])
+        ):
+            return ResamplePyramid.build(df)
+
+        tail = incoming.iloc[cached - 1 :]
+        daily = pd.concat([self.daily.iloc[: cached - 1], tail])
+        first = tail.index[0]
+        levels: Dict[str, pd.DataFrame] = {}
+        for timeframe, rule in TIMEFRAME_RULES.items():
+            previous_end = rule.rollforward(first.normalize()) - rule
+            kept = self.frame(timeframe)
+            kept = kept[kept.index <= previous_end]
+            fresh = resample_ohlc(daily[daily.index > previous_end], rule)
+            levels[timeframe] = pd.concat([kept, fresh])
+        return ResamplePyramid(daily=daily, weekly=levels["weekly"], monthly=levels["monthly"])
+
+
+class PyramidCache:
+    def __init__(self) -> None:
+        self._pyramids: Dict[str, ResamplePyramid] = {}
+
+    def get(self, key: str, df: pd.DataFrame) -> ResamplePyramid:
+        cached = self._pyramids.get(key)
+        pyramid = ResamplePyramid.build(df) if cached is None else cached.update(df)
+        self._pyramids[key] = pyramid
+        return pyramid
+
+    def clear(self) -> None:
+        self._pyramids.clear()
+
+
+_CACHE = PyramidCache()
+
+
+def resample_pyramid(key: str, df: pd.DataFrame) -> ResamplePyramid:
+    return _CACHE.get(key, df)
@@ -0,0 +1,282 @@
+"""Data-quality checks run once per ingested series version."""
+
+from __future__ import annotations
+
+import hashlib
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+from pandas.tseries.holiday import (
+    AbstractHolidayCalendar,
+    GoodFriday,
+    Holiday,
+    USLaborDay,
+    USMartinLutherKingJr,
+    USMemorialDay,
+    USPresidentsDay,
+    USThanksgivingDay,
+    nearest_workday,
+    sunday_to_monday,
+)
+from pandas.tseries.offsets import CustomBusinessDay
+
+from marketpulse.utils import read_json_or_none, write_json_atomic
+
+MAX_DAILY_MOVE = 0.15
+MAX_VIX_MOVE = 1.0
+SPLIT_RATIOS = np.array([2.0, 3.0, 4.0, 5.0, 10.0, 1 / 2, 1 / 3, 1 / 4, 1 / 5, 1 / 10])
+SPLIT_TOLERANCE = 0.03
+STALE_RUN = 3
+# Part of every cache key; bump when checks or the calendar change so stale
+# results are not served from ``QualityCache``.
+CHECKS_VERSION = 2
+
+
+# Unscheduled full-day NYSE closures (national days of mourning, 9/11, Sandy).
+SPECIAL_CLOSURES = (
+    ("Nixon funeral", "1994-04-27"),
+    ("September 11", "2001-09-11"),
+    ("September 11", "2001-09-12"),
+    ("September 11", "2001-09-13"),
+    ("September 11", "2001-09-14"),
+    ("Reagan funeral", "2004-06-11"),
+    ("Ford day of mourning", "2007-01-02"),
+    ("Hurricane Sandy", "2012-10-29"),
+    ("Hurricane Sandy", "2012-10-30"),
+    ("G.H.W. Bush day of mourning", "2018-12-05"),
+    ("Carter day of mourning", "2025-01-09"),
+)
+
+
+def _special_closure(name: str, day: str) -> Holiday:
+    date = pd.Timestamp(day)
+    return Holiday(name, year=date.year, month=date.month, day=date.day)
+
+
+class ExchangeHolidayCalendar(AbstractHolidayCalendar):
+    """US equity exchange holidays, including one-off closures since 1994.
+
+    New Year's Day falling on a Saturday is not observed on the Friday before,
+    matching NYSE practice (e.g. the exchange was open on 2021-12-31).
+    """
+
+    rules = [
+        Holiday("New Years Day", month=1, day=1, observance=sunday_to_monday),
+        USMartinLutherKingJr,
+        USPresidentsDay,
+        GoodFriday,
+        USMemorialDay,
+        Holiday("Juneteenth", month=6, day=19, start_date="2022-01-01", observance=nearest_workday),
+        Holiday("Independence Day", month=7, day=4, observance=nearest_workday),
+        USLaborDay,
+        USThanksgivingDay,
+        Holiday("Christmas", month=12, day=25, observance=nearest_workday),
+    ] + [_special_closure(name, day) for name, day in SPECIAL_CLOSURES]
+
+
+TRADING_DAY = CustomBusinessDay(calendar=ExchangeHolidayCalendar())
+
+
+@dataclass(frozen=True)
+class QualityIssue:
+    series: str
+    check: str
+    count: int
+    detail: str
+
+    def __str__(self) -> str:
+        return f"{self.series}: {self.detail}"
+
+
+def _latest(dates: pd.Series, mask: np.ndarray) -> str:
+    return pd.Timestamp(dates[mask].iloc[-1]).strftime("%Y-%m-%d")
+
+
+def _dates(df: pd.DataFrame) -> pd.Series:
+    dates = pd.to_datetime(df["date"])
+    if dates.dt.tz is not None:
+        dates = dates.dt.tz_localize(None)
+    return dates.dt.normalize().reset_index(drop=True)
+
+
+def _duplicates(series: str, dates: pd.Series) -> List[QualityIssue]:
+    mask = dates.duplicated().to_numpy()
+    count = int(mask.sum())
+    if not count:
+        return []
+    return [QualityIssue(series, "duplicates", count, f"{count} duplicate dates (latest {_latest(dates, mask)})")]
+
+
+def _calendar_gaps(series: str, dates: pd.Series) -> List[QualityIssue]:
+    if dates.empty:
+        return []
+    expected = pd.date_range(dates.min(), dates.max(), freq=TRADING_DAY)
+    missing = expected.difference(pd.DatetimeIndex(dates))
+    if missing.empty:
+        return []
+    detail = f"{len(missing)} trading sessions missing (latest {missing[-1]:%Y-%m-%d})"
+    return [QualityIssue(series, "gaps", len(missing), detail)]
+
+
+def _stale_runs(values: np.ndarray) -> np.ndarray:
+    """Rows repeating the previous row as part of a run of ``STALE_RUN`` or more."""
+    same = np.zeros(len(values), dtype=bool)
+    if len(values) > 1:
+        same[1:] = np.all(values[1:] == values[:-1], axis=1) if values.ndim == 2 else values[1:] == values[:-1]
+    run_id = np.cumsum(~same)
+    run_length = np.bincount(run_id)[run_id]
+    return same & (run_length >= STALE_RUN)
+
+
+def _moves(series: str, dates: pd.Series, close: np.ndarray, max_move: float, splits: bool) -> List[QualityIssue]:
+    issues: List[QualityIssue] = []
+    with np.errstate(divide="ignore", invalid="ignore"):
+        ratio = np.empty(len(close))
+        ratio[0] = 1.0
+        ratio[1:] = close[1:] / close[:-1]
+        move = np.abs(np.log(ratio))
+    split_like = np.zeros(len(close), dtype=bool)
+    if splits:
+        split_like = np.any(np.abs(ratio[:, None] / SPLIT_RATIOS - 1.0) < SPLIT_TOLERANCE, axis=1)
+        count = int(split_like.sum())
+        if count:
+            detail = f"{count} split-like price jumps (latest {_latest(dates, split_like)})"
+            issues.append(QualityIssue(series, "split_jumps", count, detail))
+    outliers = np.isfinite(move) & (move > max_move) & ~split_like
+    count = int(outliers.sum())
+    if count:
+        detail = f"{count} daily moves beyond {max_move:.0%} (latest {_latest(dates, outliers)})"
+        issues.append(QualityIssue(series, "outliers", count, detail))
+    return issues
+
+
+def validate_ohlcv(df: pd.DataFrame, series: str) -> List[QualityIssue]:
+    dates = _dates(df)
+    issues = _duplicates(series, dates) + _calendar_gaps(series, dates)
+    prices = df[["open", "high", "low", "close"]].to_numpy(dtype=float)
+    open_, high, low, close = prices.T
+
+    bad = ~(prices > 0).all(axis=1)
+    if bad.any():
+        count = int(bad.sum())
+        detail = f"{count} rows with zero, negative or missing prices (latest {_latest(dates, bad)})"
+        issues.append(QualityIssue(series, "nonpositive", count, detail))
+
+    inconsistent = (high < np.maximum(open_, close)) | (low > np.minimum(open_, close)) | (high < low)
+    if inconsistent.any():
+        count = int(inconsistent.sum())
+        detail = f"{count} bars with high/low outside open/close (latest {_latest(dates, inconsistent)})"
+        issues.append(QualityIssue(series, "ohlc", count, detail))
+
+    issues += _moves(series, dates, np.where(close > 0, close, np.nan), MAX_DAILY_MOVE, splits=True)
+    return issues
+
+
+def validate_vix(df: pd.DataFrame, series: str = "VIX") -> List[QualityIssue]:
+    dates = _dates(df)
+    issues = _duplicates(series, dates) + _calendar_gaps(series, dates)
+    values = df["vix"].to_numpy(dtype=float)
+
+    bad = ~(values > 0)
+    if bad.any():
+        count = int(bad.sum())
+        issues.append(QualityIssue(series, "nonpositive", count, f"{count} zero, negative or missing values"))
+
+    stale = _stale_runs(values)
+    if stale.any():
+        count = int(stale.sum())
+        detail = f"{count} stale rows repeating the prior value (latest {_latest(dates, stale)})"
+        issues.append(QualityIssue(series, "stale", count, detail))
+
+    issues += _moves(series, dates, np.where(values > 0, values, np.nan), MAX_VIX_MOVE, splits=False)
+    return issues
+
+
+def validate_breadth(df: pd.DataFrame, series: str = "breadth") -> List[QualityIssue]:
+    dates = _dates(df)
+    issues = _duplicates(series, dates) + _calendar_gaps(series, dates)
+    counts = df[["advances", "declines", "new_highs", "new_lows"]].to_numpy(dtype=float)
+
+    bad = ~(counts >= 0).all(axis=1)
+    if bad.any():
+        count = int(bad.sum())
+        issues.append(QualityIssue(series, "negative", count, f"{count} rows with negative or missing counts"))
+
+    empty = (counts[:, 0] + counts[:, 1]) == 0
+    if empty.any():
+        count = int(empty.sum())
+        detail = f"{count} placeholder rows with no advances or declines (latest {_latest(dates, empty)})"
+        issues.append(QualityIssue(series, "placeholder", count, detail))
+
+    stale = _stale_runs(counts)
+    if stale.any():
+        count = int(stale.sum())
+        detail = f"{count} stale rows repeating the prior row (latest {_latest(dates, stale)})"
+        issues.append(QualityIssue(series, "stale", count, detail))
+    return issues
+
+
+VALIDATORS: Dict[str, Callable[[pd.DataFrame, str], List[QualityIssue]]] = {
+    "ohlcv": validate_ohlcv,
+    "vix": validate_vix,
+    "breadth": validate_breadth,
+}
+
+
+def content_hash(df: pd.DataFrame) -> str:
+    hashed = pd.util.hash_pandas_object(df, index=False).to_numpy()
+    digest = hashlib.sha1(hashed.tobytes())
+    digest.update(",".join(map(str, df.columns)).encode("utf-8"))
+    return digest.hexdigest()
+
+
+class QualityCache:
+    """Validation results keyed by the content hash of the frame they were computed for.
+
+    The cache is disposable: an unreadable file or entry is treated as a miss
+    and a failed write is ignored, so it can never break ingest.
+    """
+
+    def __init__(self, path: Optional[Path] = None, max_entries: int = 32) -> None:
+        self.path = path
+        self.max_entries = max_entries
+        self._entries: Dict[str, List[dict]] = {}
+        if path is not None:
+            saved = read_json_or_none(path)
+            if isinstance(saved, dict):
+                self._entries = saved
+
+    def get(self, digest: str) -> Optional[List[QualityIssue]]:
+        entry = self._entries.get(digest)
+        if entry is None:
+            return None
+        try:
+            return [QualityIssue(**issue) for issue in entry]
+        except TypeError:
+            return None
+
+    def put(self, digest: str, issues: List[QualityIssue]) -> None:
+        self._entries.pop(digest, None)
+        self._entries[digest] = [asdict(issue) for issue in issues]
+        while len(self._entries) > self.max_entries:
+            del self._entries[next(iter(self._entries))]
+        if self.path is not None:
+            try:
+                write_json_atomic(self.path, self._entries)
+            except OSError:
+                pass
+
+
+def validate(kind: str, series: str, df: pd.DataFrame, cache: Optional[QualityCache] = None) -> List[QualityIssue]:
+    """Validate ``df`` unless ``cache`` already holds a result for this exact content."""
+    if cache is None:
+        return VALIDATORS[kind](df, series)
+    digest = f"v{CHECKS_VERSION}:{kind}:{series}:{content_hash(df)}"
+    issues = cache.get(digest)
+    if issues is None:
+        issues = VALIDATORS[kind](df, series)
+        cache.put(digest, issues)
+    return issues
@@ -0,0 +1,264 @@
+"""Bootstrap confidence bands for the pulse score."""
+
+from __future__ import annotations
+
+from collections import deque
+from typing import Dict, Iterator, Optional, Union
+
+import numpy as np
+
+from marketpulse.config import DEFAULT_CONFIG, MarketPulseConfig
+from marketpulse.engine import SIGNAL_NAMES, DataBundle, breadth_flows, is_scored, rsp_spy_ratio
+from marketpulse.models import ScoreBand, Vote
+
+Alpha = Union[float, np.ndarray]
+
+
+
+class _Path:
+    """A history shared by all samples followed by a per-sample tail.
+
+    ``base`` holds the observed series; its last ``tail.shape[1]`` values are
+    replaced by the rows of ``tail`` (one per sample).
+    """
+
+    def __init__(self, base: np.ndarray, tail: np.ndarray) -> None:
+        self.base = np.asarray(base, dtype=float)
+        self.tail = tail
+        self.samples, self.horizon = tail.shape
+
+    def __len__(self) -> int:
+        return len(self.base)
+
+    def columns(self) -> Iterator[Union[float, np.ndarray]]:
+        yield from self.base[: len(self.base) - self.horizon]
+        for column in range(self.horizon):
+            yield self.tail[:, column]
+
+    def last(self, count: int) -> np.ndarray:
+        """The final ``count`` values for every sample, shape (samples, count)."""
+        count = min(count, len(self.base))
+        from_tail = min(count, self.horizon)
+        fixed = self.base[len(self.base) - self.horizon - (count - from_tail) : len(self.base) - self.horizon]
+        head = np.broadcast_to(fixed, (self.samples, len(fixed)))
+        return np.concatenate([head, self.tail[:, self.horizon - from_tail :]], axis=1)
+
+
+def _ema(path: _Path, alpha: Alpha, keep: int = 1) -> np.ndarray:
+    """``adjust=False`` EMA over every sample; returns the last ``keep`` values."""
+    columns = path.columns()
+    state = np.broadcast_to(np.asarray(next(columns), dtype=float), (path.samples,)).copy()
+    recent = deque([state.copy()], maxlen=keep)
+    for value in columns:
+        state += alpha * (value - state)
+        recent.append(state.copy())
+    return np.stack(recent, axis=1)
+
+
+def _macd(path: _Path, fast: Alpha, slow: Alpha, signal: Alpha) -> tuple[np.ndarray, np.ndarray]:
+    columns = path.columns()
+    first = np.broadcast_to(np.asarray(next(columns), dtype=float), (path.samples,))
+    ema_fast, ema_slow = first.copy(), first.copy()
+    signal_line = np.zeros(path.samples)
+    for value in columns:
+        ema_fast += fast * (value - ema_fast)
+        ema_slow += slow * (value - ema_slow)
+        signal_line += signal * ((ema_fast - ema_slow) - signal_line)
+    return ema_fast - ema_slow, signal_line
+
+
+def _sma_last(path: _Path, window: np.ndarray) -> np.ndarray:
+    """Last value of ``sma`` (min_periods=1) with a per-sample window."""
+    window = np.minimum(window, len(path))
+    recent = path.last(int(window.max()))[:, ::-1]
+    sums = np.cumsum(recent, axis=1)[np.arange(path.samples), window - 1]
+    return sums / window
+
+
+def _alpha(span: np.ndarray) -> np.ndarray:
+    return 2.0 / (span + 1.0)
+
+
+def _resample_levels(values: np.ndarray, idx: np.ndarray) -> _Path:
+    """Rebuild the last ``horizon`` levels from bootstrapped log changes."""
+    horizon = idx.shape[1]
+    if horizon == 0:
+        return _Path(values, idx.astype(float))
+    changes = np.diff(np.log(values[-horizon - 1 :]))
+    tail = values[-horizon - 1] * np.exp(np.cumsum(changes[idx], axis=1))
+    return _Path(values, tail)
+
+
+def _resample_flows(values: np.ndarray, idx: np.ndarray) -> _Path:
+    horizon = idx.shape[1]
+    return _Path(values, values[len(values) - horizon :][idx])
+
+
+def _block_indices(rng: np.random.Generator, samples: int, horizon: int, block: int) -> np.ndarray:
+    if horizon == 0:
+        return np.zeros((samples, 0), dtype=np.intp)
+    block = max(1, min(block, horizon))
+    blocks = -(-horizon // block)
+    starts = rng.integers(0, horizon - block + 1, size=(samples, blocks))
+    return (starts[:, :, None] + np.arange(block)).reshape(samples, -1)[:, :horizon]
+
+
+def _jitter(rng: np.random.Generator, span: int, samples: int, amount: float) -> np.ndarray:
+    factors = rng.uniform(1.0 - amount, 1.0 + amount, size=samples)
+    return np.maximum(np.rint(span * factors), 2).astype(np.intp)
+
+
+def _percentile_last(path: _Path, window: int) -> Optional[np.ndarray]:
+    if len(path) < window:
+        return None
+    recent = path.last(window)
+    return (recent <= recent[:, -1:]).mean(axis=1) * 100.0
+
+
+def _zscore_last(path: _Path, window: int) -> Optional[np.ndarray]:
+    if len(path) < window:
+        return None
+    recent = path.last(window)
+    std = recent.std(axis=1, ddof=1)
+    deviation = recent[:, -1] - recent.mean(axis=1)
+    return np.divide(deviation, std, out=np.zeros_like(deviation), where=std > 0)
+
+
+def _bool_vote(condition: np.ndarray) -> np.ndarray:
+    return np.where(condition, 1, -1)
+
+
+def sample_votes(
+    bundle: DataBundle,
+    config: MarketPulseConfig = DEFAULT_CONFIG,
+    samples: int = 1000,
+    rng: Optional[np.random.Generator] = None,
+    horizon: Optional[int] = None,
+    block: Optional[int] = None,
+    jitter: Optional[float] = None,
+) -> np.ndarray:
+    """Votes (BULL=1, NEUTRAL/N/A=0, BEAR=-1) per resample, in ``SIGNAL_NAMES`` order.
+
+    The last ``horizon`` bars of every input are rebuilt from one shared
+    moving-block bootstrap of their recent changes, and indicator spans are
+    scaled by an independent factor in ``1 +/- jitter`` per sample. All samples
+    advance together as NumPy arrays. With ``horizon=0`` and ``jitter=0`` every
+    row reproduces the engine's votes.
+    """
+    if samples < 1:
+        raise ValueError(f"samples must be at least 1, got {samples}")
+    rng = rng or np.random.default_rng()
+    horizon = config.robust_horizon if horizon is None else horizon
+    block = config.robust_block if block is None else block
+    jitter = config.robust_window_jitter if jitter is None else jitter
+    panel = bundle.panel
+
+    spy_daily = bundle.pyramid("SPY").daily["close"]
+    spy_weekly = bundle.pyramid("SPY").weekly["close"]
+    vix = panel.series("vix").to_numpy()
+    ratio = rsp_spy_ratio(panel).to_numpy()
+    lengths = [len(spy_daily), len(vix), len(ratio)]
+    if bundle.has_breadth:
+        flows = breadth_flows(panel)
+        ad = flows["ad"].to_numpy()
+        nhnl = flows["nhnl"].to_numpy()
+        lengths.append(len(ad))
+    horizon = max(0, min(horizon, min(lengths) - 1))
+    idx = _block_indices(rng, samples, horizon, block)
+
+    def spans(span: int) -> np.ndarray:
+        return _jitter(rng, span, samples, jitter)
+
+    votes: Dict[str, np.ndarray] = {}
+
+    # Weekly trend: perturbed daily closes feed the weekly bars they close.
+    daily = _resample_levels(spy_daily.to_numpy(), idx)
+    last_rows = spy_daily.index.searchsorted(spy_weekly.index, side="right") - 1
+    touched = last_rows >= len(spy_daily) - horizon
+    week_tail = daily.tail[:, last_rows[touched] - (len(spy_daily) - horizon)]
+    weekly = _Path(spy_weekly.to_numpy(), week_tail)
+    macd_line, signal_line = _macd(weekly, _alpha(spans(12)), _alpha(spans(26)), _alpha(spans(9)))
+    votes["Weekly MACD"] = _bool_vote(macd_line > signal_line)
+    votes["8/21 Weekly MA"] = _bool_vote(_sma_last(weekly, spans(8)) > _sma_last(weekly, spans(21)))
+    ema8 = _ema(weekly, _alpha(spans(8)), keep=2)
+    votes["8W EMA Slope"] = _bool_vote(ema8[:, -1] - ema8[:, 0] > 0)
+
+    osc_recent = None
+    if bundle.has_breadth:
+        ad_path = _resample_flows(ad, idx)
+        cum_ad = _Path(np.cumsum(ad), np.cumsum(ad)[len(ad) - horizon - 1] + np.cumsum(ad_path.tail, axis=1))
+        ad_ema = _ema(cum_ad, _alpha(spans(89)))[:, -1]
+        votes["Cum A/D vs 89-EMA"] = _bool_vote(cum_ad.last(1)[:, 0] > ad_ema)
+
+        nhnl_path = _resample_flows(nhnl, idx)
+        cum_nhnl = _Path(
+            np.cumsum(nhnl), np.cumsum(nhnl)[len(nhnl) - horizon - 1] + np.cumsum(nhnl_path.tail, axis=1)
+        )
+        votes["NHNL Cum vs 10-MA"] = _bool_vote(cum_nhnl.last(1)[:, 0] > _sma_last(cum_nhnl, spans(10)))
+
+        keep = max(config.rank_window, 5)
+        osc_recent = _ema(ad_path, _alpha(spans(19)), keep) - _ema(ad_path, _alpha(spans(39)), keep)
+        if len(ad) > 6:
+            nysi_slope = osc_recent[:, -5:].sum(axis=1)
+        else:
+            nysi_slope = osc_recent[:, -1]
+        votes["NYSI Slope"] = _bool_vote(nysi_slope > 0)
+
+    vix_path = _resample_levels(vix, idx)
+    vix_last = vix_path.last(1)[:, 0]
+    votes["VIX Regime"] = np.select([vix_last < config.vix_bull, vix_last <= config.vix_neutral], [1, 0], default=-1)
+
+    ratio_path = _resample_levels(ratio, idx)
+    ratio_recent = ratio_path.last(2)
+    ratio_sma = _sma_last(ratio_path, spans(50))
+    rising = ratio_recent[:, -1] - ratio_recent[:, 0] > 0
+    votes["RSP/SPY Breadth"] = _bool_vote((ratio_recent[:, -1] > ratio_sma) & rising)
+
+    window = config.rank_window
+    vix_pct = _percentile_last(vix_path, window)
+    if vix_pct is not None:
+        bands = [vix_pct < config.vix_pct_bull, vix_pct <= config.vix_pct_neutral]
+        votes["VIX 1Y Percentile"] = np.select(bands, [1, 0], default=-1)
+
+    ratio_z = _zscore_last(ratio_path, window)
+    if ratio_z is not None:
+        votes["RSP/SPY Z-Score"] = _bool_vote(ratio_z > 0)
+
+    if osc_recent is not None and len(ad) >= window:
+        osc_window = osc_recent[:, -window:]
+        osc_pct = (osc_window <= osc_window[:, -1:]).mean(axis=1) * 100.0
+        votes["Breadth Osc Percentile"] = _bool_vote(osc_pct > 50)
+
+    unknown = set(votes) - set(SIGNAL_NAMES)
+    if unknown:
+        raise ValueError(f"Sampled votes for unknown signals: {sorted(unknown)}")
+    # Signals without enough data vote N/A (0), as in ``build_signals``.
+    missing = np.zeros(samples, dtype=int)
+    return np.stack([votes.get(name, missing) for name in SIGNAL_NAMES], axis=1)
+
+
+def scores_from_votes(votes: np.ndarray, config: MarketPulseConfig = DEFAULT_CONFIG) -> np.ndarray:
+    """``score_signals`` for every row of ``sample_votes`` output."""
+    votes = votes[:, [is_scored(name, config) for name in SIGNAL_NAMES]]
+    count = max(votes.shape[1], 1)
+    return np.rint((votes.sum(axis=1) + count) / (2 * count) * 100).astype(int)
+
+
+def estimate_band(
+    bundle: DataBundle,
+    config: MarketPulseConfig = DEFAULT_CONFIG,
+    samples: Optional[int] = None,
+    seed: Optional[int] = None,
+) -> ScoreBand:
+    """5th/50th/95th percentile score and label frequencies over bootstrap resamples."""
+    samples = config.robust_samples if samples is None else samples
+    seed = config.robust_seed if seed is None else seed
+    scores = scores_from_votes(sample_votes(bundle, config, samples, np.random.default_rng(seed)), config)
+    low, median, high = np.percentile(scores, [5, 50, 95])
+    labels = np.select(
+        [scores >= config.score_bull, scores >= config.score_neutral],
+        [Vote.BULL.value, Vote.NEUTRAL.value],
+        default=Vote.BEAR.value,
+    )
+    odds = {vote.value: float(np.mean(labels == vote.value)) for vote in (Vote.BULL, Vote.NEUTRAL, Vote.BEAR)}
+    return ScoreBand(samples=samples, low=int(low), median=int(round(median)), high=int(np.ceil(high)), label_odds=odds)
@@ -0,0 +1,103 @@
+"""Rolling order statistics and moments usable in batch or bar by bar."""
+
+from __future__ import annotations
+
+import math
+from bisect import bisect_left, bisect_right, insort
+from collections import deque
+from typing import Deque, List, Optional
+
+import numpy as np
+import pandas as pd
+
+
+class RollingRank:
+    """Fixed-size window kept in sorted order for percentile-rank queries.
+
+    Inserts, evictions and rank lookups locate their slot by binary search;
+    the shift inside the backing list is a single memmove.
+    """
+
+    def __init__(self, window: int, min_periods: Optional[int] = None) -> None:
+        self.window = window
+        self.min_periods = window if min_periods is None else min_periods
+        self._order: Deque[float] = deque()
+        self._sorted: List[float] = []
+
+    def __len__(self) -> int:
+        return len(self._order)
+
+    def push(self, value: float) -> None:
+        self._order.append(value)
+        insort(self._sorted, value)
+        if len(self._order) > self.window:
+            evicted = self._order.popleft()
+            del self._sorted[bisect_left(self._sorted, evicted)]
+
+    def percentile(self, value: float) -> float:
+        """Share of the window at or below ``value``, in percent."""
+        if len(self._sorted) < self.min_periods:
+            return math.nan
+        return bisect_right(self._sorted, value) / len(self._sorted) * 100.0
+
+    def update(self, value: float) -> float:
+        if math.isnan(value):
+            return math.nan
+        self.push(value)
+        return self.percentile(value)
+
+
+class RollingMoments:
+    """Welford mean/variance over a fixed-size window with O(1) add and evict."""
+
+    def __init__(self, window: int, min_periods: Optional[int] = None) -> None:
+        self.window = window
+        self.min_periods = window if min_periods is None else min_periods
+        self._order: Deque[float] = deque()
+        self.mean = 0.0
+        self._m2 = 0.0
+
+    def __len__(self) -> int:
+        return len(self._order)
+
+    @property
+    def variance(self) -> float:
+        n = len(self._order)
+        return max(self._m2 / (n - 1), 0.0) if n > 1 else math.nan
+
+    def push(self, value: float) -> None:
+        self._order.append(value)
+        delta = value - self.mean
+        self.mean += delta / len(self._order)
+        self._m2 += delta * (value - self.mean)
+        if len(self._order) > self.window:
+            evicted = self._order.popleft()
+            delta = evicted - self.mean
+            self.mean -= delta / len(self._order)
+            self._m2 -= delta * (evicted - self.mean)
+
+    def zscore(self, value: float) -> float:
+        if len(self._order) < self.min_periods:
+            return math.nan
+        std = math.sqrt(self.variance)
+        return (value - self.mean) / std if std > 0 else 0.0
+
+    def update(self, value: float) -> float:
+        if math.isnan(value):
+            return math.nan
+        self.push(value)
+        return self.zscore(value)
+
+
+def _run(series: pd.Series, stat) -> pd.Series:
+    values = series.to_numpy(dtype=float)
+    out = np.fromiter((stat.update(value) for value in values), dtype=float, count=len(values))
+    return pd.Series(out, index=series.index, name=series.name)
+
+
+def rolling_percentile(series: pd.Series, window: int, min_periods: Optional[int] = None) -> pd.Series:
+    return _run(series, RollingRank(window, min_periods))
+
+
+def rolling_zscore(series: pd.Series, window: int, min_periods: Optional[int] = None) -> pd.Series:
+    return _run(series, RollingMoments(window, min_periods))
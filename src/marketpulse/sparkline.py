@@ -0,0 +1,68 @@
+"""Sparkline rendering with LTTB downsampling."""
+
+from __future__ import annotations
+
+import hashlib
+from typing import Dict, Hashable, Tuple
+
+import numpy as np
+import pandas as pd
+
+BLOCKS = "▁▂▃▄▅▆▇█"
+
+
+def lttb(values: np.ndarray, threshold: int) -> np.ndarray:
+    """Return the indices kept by Largest-Triangle-Three-Buckets downsampling."""
+    n = len(values)
+    if threshold >= n or threshold < 3:
+        return np.arange(n)
+    y = np.asarray(values, dtype=float)
+    x = np.arange(n, dtype=float)
+    edges = np.floor(np.linspace(1, n - 1, threshold - 1)).astype(int)
+    kept = np.empty(threshold, dtype=int)
+    kept[0] = 0
+    kept[-1] = n - 1
+    anchor = 0
+    for bucket in range(threshold - 2):
+        start, stop = edges[bucket], edges[bucket + 1]
+        next_start, next_stop = stop, edges[bucket + 2] if bucket + 2 < len(edges) else n
+        next_x = x[next_start:next_stop].mean()
+        next_y = y[next_start:next_stop].mean()
+        areas = np.abs(
+            (x[anchor] - next_x) * (y[start:stop] - y[anchor])
+            - (x[anchor] - x[start:stop]) * (next_y - y[anchor])
+        )
+        anchor = start + int(np.argmax(areas))
+        kept[bucket + 1] = anchor
+    return kept
+
+
+def sparkline(values: np.ndarray, width: int) -> str:
+    y = np.asarray(values, dtype=float)
+    y = y[np.isfinite(y)]
+    if len(y) == 0 or width <= 0:
+        return ""
+    y = y[lttb(y, width)]
+    low, high = y.min(), y.max()
+    if high == low:
+        return BLOCKS[len(BLOCKS) // 2] * len(y)
+    levels = ((y - low) / (high - low) * (len(BLOCKS) - 1)).round().astype(int)
+    return "".join(BLOCKS[level] for level in levels)
+
+
+class SparklineCache:
+    """Memoize rendered sparklines per series until the series or width changes."""
+
+    def __init__(self) -> None:
+        self._entries: Dict[Hashable, Tuple[Hashable, str]] = {}
+
+    def get(self, key: Hashable, series: pd.Series, width: int) -> str:
+        values = np.ascontiguousarray(series.to_numpy(dtype=float))
+        # Hash every value: restated history (e.g. adjusted closes) must re-render.
+        token = (width, hashlib.sha1(values.tobytes()).hexdigest())
+        cached = self._entries.get(key)
+        if cached is not None and cached[0] == token:
+            return cached[1]
+        text = sparkline(values, width)
+        self._entries[key] = (token, text)
+        return text
@@ -9,12 +9,21 @@ def summary_text(snapshot: MarketPulseSnapshot) -> str:
     lines = [
         f"Market Pulse {snapshot.label.value} ({snapshot.score}/100) as of {snapshot.as_of}",
         f"VIX: {snapshot.extras.get('vix', 'N/A')} | RSP/SPY: {snapshot.extras.get('rsp_spy', 'N/A')}",
-        "",
-        "Signals:",
+        f"Trend by timeframe: {snapshot.extras.get('mtf', 'N/A')} (combined {snapshot.extras.get('mtf_score', 'N/A')}/100)",
     ]
+    if snapshot.band is not None:
+        band = snapshot.band
+        odds = ", ".join(f"{label} {share:.0%}" for label, share in band.label_odds.items())
+        lines.append(f"Score 90% band: {band.low}-{band.high} (median {band.median}, {band.samples} resamples) | {odds}")
+    lines.extend(["", "Signals:"])
     for signal in snapshot.signals:
         vote = signal.vote.value
         lines.append(f"- {signal.name}: {vote} ({signal.detail})")
+    if snapshot.quality:
+        lines.append("")
+        lines.append("Data quality:")
+        for issue in snapshot.quality:
+            lines.append(f"- {issue}")
     if snapshot.conflicts:
         lines.append("")
         lines.append("Conflicts:")
@@ -2,9 +2,12 @@
 
 from __future__ import annotations
 
+import json
+import os
+import tempfile
 from datetime import datetime
 from pathlib import Path
-from typing import Iterable
+from typing import Any, Iterable, Optional
 
 import pandas as pd
 
@@ -13,10 +16,42 @@ def ensure_dir(path: Path) -> None:
     path.mkdir(parents=True, exist_ok=True)
 
 
+def write_json_atomic(path: Path, payload: Any) -> None:
+    """Write ``payload`` to a temp file beside ``path`` and rename it into place.
+
+    Readers (and concurrent writers) see either the old file or the new one,
+    never a partial write.
+    """
+    ensure_dir(path.parent)
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as handle:
+            json.dump(payload, handle)
+        os.replace(tmp, path)
+    except BaseException:
+        Path(tmp).unlink(missing_ok=True)
+        raise
+
+
+def read_json_or_none(path: Path) -> Optional[Any]:
+    """Parsed contents of ``path``, or None when it is missing or unreadable."""
+    try:
+        return json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+
+
 def parse_date(value: str) -> datetime:
     return pd.to_datetime(value).to_pydatetime()
 
 
+def trim_history(df: pd.DataFrame, bars: Optional[int] = None) -> pd.DataFrame:
+    """Keep the last ``bars`` rows, counted back from the series' own latest date."""
+    if bars is None or len(df) <= bars:
+        return df
+    return df.iloc[-bars:].reset_index(drop=True)
+
+
 def normalize_ohlcv(df: pd.DataFrame) -> pd.DataFrame:
     columns = {"date": "date", "open": "open", "high": "high", "low": "low", "close": "close", "volume": "volume"}
     lower = {col.lower(): col for col in df.columns}
@@ -1,8 +1,39 @@
 import sys
 from pathlib import Path
 
+import numpy as np
+import pandas as pd
+import pytest
+
 
 ROOT = Path(__file__).resolve().parents[1]
 SRC = ROOT / "src"
 if str(SRC) not in sys.path:
     sys.path.insert(0, str(SRC))
+
+
+@pytest.fixture
+def market_frames():
+    """Synthetic SPY, RSP, VIX and breadth frames covering about 14 years."""
+    rng = np.random.default_rng(7)
+    dates = pd.bdate_range("2010-01-04", periods=3600)
+    n = len(dates)
+    spy_close = 100 * np.exp(np.cumsum(rng.normal(0.0003, 0.01, n)))
+    rsp_close = spy_close * 0.3 * np.exp(np.cumsum(rng.normal(0, 0.002, n)))
+
+    def ohlcv(close):
+        return pd.DataFrame(
+            {"date": dates, "open": close, "high": close * 1.01, "low": close * 0.99, "close": close, "volume": 1e6}
+        )
+
+    vix = pd.DataFrame({"date": dates, "vix": 15 + 10 * np.abs(np.sin(np.arange(n) / 60)) + rng.normal(0, 1, n)})
+    breadth = pd.DataFrame(
+        {
+            "date": dates,
+            "advances": rng.integers(1000, 2000, n),
+            "declines": rng.integers(1000, 2000, n),
+            "new_highs": rng.integers(0, 200, n),
+            "new_lows": rng.integers(0, 200, n),
+        }
+    )
+    return {"spy": ohlcv(spy_close), "rsp": ohlcv(rsp_close), "vix": vix, "breadth": breadth}
@@ -0,0 +1,121 @@
+import json
+import time
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from marketpulse.alerts import Alert, AlertEngine, AlertRule, AlertSink, snapshot_state
+from marketpulse.models import MarketPulseSnapshot, Signal, Vote
+
+
+class ListSink(AlertSink):
+    def __init__(self) -> None:
+        self.alerts: list[Alert] = []
+
+    def deliver(self, alerts):
+        self.alerts.extend(alerts)
+
+
+def _snapshot(score: int, label: Vote, vix_vote: Vote, as_of: str = "2024-01-02") -> MarketPulseSnapshot:
+    signals = [Signal("VIX Regime", vix_vote, 20.0, "")]
+    return MarketPulseSnapshot(as_of, score, label, signals, [], {})
+
+
+def test_threshold_rules_are_edge_triggered():
+    sink = ListSink()
+    engine = AlertEngine([AlertRule("hot", "above", "score", threshold=60)], sinks=[sink])
+    for score in (50, 70, 75, 40, 65):
+        engine.evaluate(_snapshot(score, Vote.NEUTRAL, Vote.BULL), now=0.0)
+    assert [alert.value for alert in sink.alerts] == [70.0, 65.0]
+
+
+def test_change_and_streak_rules():
+    rules = [
+        AlertRule("flip", "change", "label"),
+        AlertRule("vix", "change", "vote:VIX Regime"),
+        AlertRule("bears", "streak", "vote:VIX Regime", target="BEAR", count=2),
+    ]
+    sink = ListSink()
+    engine = AlertEngine(rules, sinks=[sink])
+    engine.evaluate(_snapshot(50, Vote.NEUTRAL, Vote.BULL, "2024-01-02"), now=0.0)
+    engine.evaluate(_snapshot(30, Vote.BEAR, Vote.BEAR, "2024-01-03"), now=1.0)
+    engine.evaluate(_snapshot(30, Vote.BEAR, Vote.BEAR, "2024-01-04"), now=2.0)
+    engine.evaluate(_snapshot(30, Vote.BEAR, Vote.BEAR, "2024-01-05"), now=3.0)
+    assert [(alert.rule_id, alert.fired_at) for alert in sink.alerts] == [
+        ("flip", 1.0),
+        ("vix", 1.0),
+        ("bears", 2.0),
+    ]
+
+
+def test_streak_counts_snapshot_dates_not_refreshes(tmp_path: Path):
+    rule = AlertRule("bears", "streak", "vote:VIX Regime", target="BEAR", count=3)
+    sink = ListSink()
+    state_path = tmp_path / "state.json"
+    engine = AlertEngine([rule], sinks=[sink], state_path=state_path)
+    for now in range(5):
+        engine.evaluate(_snapshot(30, Vote.BEAR, Vote.BEAR, "2024-01-02"), now=float(now))
+    engine.evaluate(_snapshot(30, Vote.BEAR, Vote.BEAR, "2024-01-03"), now=5.0)
+    assert sink.alerts == []
+
+    restored = AlertEngine([rule], sinks=[sink], state_path=state_path)
+    restored.evaluate(_snapshot(30, Vote.BEAR, Vote.BEAR, "2024-01-03"), now=6.0)
+    assert sink.alerts == []
+    restored.evaluate(_snapshot(30, Vote.BEAR, Vote.BEAR, "2024-01-04"), now=7.0)
+    assert [alert.fired_at for alert in sink.alerts] == [7.0]
+
+
+def test_cooldown_debounces_and_state_persists(tmp_path: Path):
+    state_path = tmp_path / "state.json"
+    rules = [AlertRule("flip", "change", "label", cooldown=60)]
+    first = ListSink()
+    engine = AlertEngine(rules, sinks=[first], state_path=state_path)
+    engine.evaluate(_snapshot(50, Vote.NEUTRAL, Vote.BULL), now=0.0)
+    engine.evaluate(_snapshot(70, Vote.BULL, Vote.BULL), now=10.0)
+    assert len(first.alerts) == 1
+    assert json.loads(state_path.read_text())["market"]["rules"]["flip"]["last_fired"] == 10.0
+
+    second = ListSink()
+    restored = AlertEngine(rules, sinks=[second], state_path=state_path)
+    restored.evaluate(_snapshot(30, Vote.BEAR, Vote.BULL), now=20.0)
+    restored.evaluate(_snapshot(70, Vote.BULL, Vote.BULL), now=80.0)
+    assert [alert.fired_at for alert in second.alerts] == [80.0]
+
+
+def test_corrupt_state_file_starts_fresh(tmp_path: Path):
+    state_path = tmp_path / "state.json"
+    state_path.write_text('{"market": {"values": {"lab', encoding="utf-8")
+    sink = ListSink()
+    engine = AlertEngine([AlertRule("hot", "above", "score", threshold=60)], sinks=[sink], state_path=state_path)
+    engine.evaluate(_snapshot(70, Vote.BULL, Vote.BULL), now=0.0)
+    assert len(sink.alerts) == 1
+    assert json.loads(state_path.read_text())["market"]["rules"]["hot"]["active"] is True
+    assert [path.name for path in tmp_path.iterdir()] == ["state.json"]
+
+
+def test_thousands_of_rules_evaluate_quickly():
+    rules = [AlertRule(f"r{i}", "above", "score", threshold=float(i % 100)) for i in range(5000)]
+    engine = AlertEngine(rules, sinks=[ListSink()])
+    state = snapshot_state(_snapshot(55, Vote.NEUTRAL, Vote.BULL))
+    start = time.perf_counter()
+    fired = engine.check("market", state, now=0.0)
+    elapsed = time.perf_counter() - start
+    assert len(fired) == 2750
+    assert elapsed < 0.5
+    assert np.all(engine.states["market"].active[:55])
+
+
+@pytest.mark.parametrize(
+    "rule",
+    [
+        AlertRule("typo", "above", "scroe", threshold=60),
+        AlertRule("signal", "change", "vote:VIX Regme"),
+        AlertRule("no-threshold", "below", "score"),
+        AlertRule("no-target", "streak", "vote:VIX Regime", count=3),
+        AlertRule("kind", "crosses", "score", threshold=60),
+    ],
+)
+def test_rules_that_cannot_fire_are_rejected(rule: AlertRule):
+    with pytest.raises(ValueError):
+        AlertEngine([rule], sinks=[ListSink()])
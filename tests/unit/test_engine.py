@@ -1,4 +1,9 @@
-from marketpulse.engine import score_signals
+from dataclasses import replace
+
+import numpy as np
+
+from marketpulse.config import DEFAULT_CONFIG
+from marketpulse.engine import DataBundle, breadth_flows, score_signals
 from marketpulse.models import Signal, Vote
 
 
@@ -11,3 +16,23 @@ def test_score_signals_labels():
     score, label = score_signals(signals)
     assert 0 <= score <= 100
     assert label in {Vote.BULL, Vote.NEUTRAL, Vote.BEAR}
+
+
+def test_breadth_gaps_are_skipped_not_zeroed(market_frames):
+    breadth = market_frames["breadth"]
+    gappy = breadth.drop(index=[100, 2500]).reset_index(drop=True)
+    bundle = DataBundle.from_frames(market_frames["spy"], market_frames["rsp"], market_frames["vix"], gappy)
+    flows = breadth_flows(bundle.panel)
+    assert len(flows["ad"]) == len(gappy)
+    expected = (gappy["advances"] - gappy["declines"]).to_numpy(dtype=float)
+    np.testing.assert_array_equal(flows["ad"].to_numpy(), expected)
+
+
+def test_rank_signals_do_not_reweight_score_by_default():
+    signals = [
+        Signal("VIX Regime", Vote.BULL, 15.0, ""),
+        Signal("VIX 1Y Percentile", Vote.BEAR, 90.0, ""),
+        Signal("RSP/SPY Z-Score", Vote.BEAR, -1.0, ""),
+    ]
+    assert score_signals(signals) == (100, Vote.BULL)
+    assert score_signals(signals, replace(DEFAULT_CONFIG, score_rank_signals=True))[0] == 33
@@ -0,0 +1,87 @@
+import json
+from dataclasses import replace
+from pathlib import Path
+
+from marketpulse.feed import SnapshotFeed, apply_message, decode_binary, encode_binary, snapshot_fields
+from marketpulse.models import MarketPulseSnapshot, Signal, Vote
+
+
+def _snapshot(vote: Vote = Vote.BULL, value: float = 1.5) -> MarketPulseSnapshot:
+    signals = [Signal("Weekly MACD", vote, value, f"MACD {value:.2f}"), Signal("VIX Regime", Vote.BULL, 14.0, "VIX 14.00")]
+    return MarketPulseSnapshot("2024-01-02", 64, Vote.BULL, signals, [], {"vix": "14.00"})
+
+
+def test_deltas_carry_only_changed_fields():
+    feed = SnapshotFeed()
+    assert feed.publish(_snapshot()) == 1
+    assert feed.publish(_snapshot()) == 1
+    assert feed.publish(_snapshot(Vote.BEAR, -0.5)) == 2
+    message = feed.changes_since(1)
+    assert message["seq"] == 2
+    assert message["set"] == {
+        "signals.Weekly MACD.vote": "BEAR",
+        "signals.Weekly MACD.value": -0.5,
+        "signals.Weekly MACD.detail": "MACD -0.50",
+    }
+    assert feed.changes_since(2)["set"] == {}
+
+
+def test_client_catches_up_from_any_sequence():
+    feed = SnapshotFeed(capacity=2)
+    snapshots = [_snapshot(value=float(v)) for v in range(4)]
+    snapshots.append(replace(snapshots[-1], extras={}))
+    client: dict = {}
+    for snap in snapshots:
+        feed.publish(snap)
+    assert "full" in feed.changes_since(1)
+    caught_up = apply_message(snapshot_fields(snapshots[2]), feed.changes_since(3))
+    assert caught_up == snapshot_fields(snapshots[-1])
+    assert "extras.vix" in feed.changes_since(3)["del"]
+    assert apply_message(client, feed.changes_since(0)) == snapshot_fields(snapshots[-1])
+
+
+def test_binary_round_trip_is_smaller_than_json():
+    feed = SnapshotFeed()
+    feed.publish(_snapshot())
+    message = feed.changes_since(0)
+    encoded = encode_binary(message)
+    assert decode_binary(encoded) == json.loads(json.dumps(message))
+    assert len(encoded) < len(json.dumps(message, separators=(",", ":")))
+    assert decode_binary(encode_binary({"n": -3, "big": 300, "x": None, "ok": True})) == {
+        "n": -3,
+        "big": 300,
+        "x": None,
+        "ok": True,
+    }
+
+
+def test_feed_persists_sequence(tmp_path: Path):
+    path = tmp_path / "feed.json"
+    feed = SnapshotFeed(path=path)
+    feed.publish(_snapshot())
+    feed.publish(_snapshot(Vote.BEAR))
+    restored = SnapshotFeed(path=path)
+    assert restored.seq == 2
+    assert restored.changes_since(1) == feed.changes_since(1)
+    assert restored.publish(_snapshot(Vote.BEAR)) == 2
+
+
+def test_nan_values_do_not_create_deltas():
+    feed = SnapshotFeed()
+    assert feed.publish(_snapshot(value=float("nan"))) == 1
+    assert feed.publish(_snapshot(value=float("nan"))) == 1
+    assert feed.fields["signals.Weekly MACD.value"] is None
+    assert "NaN" not in json.dumps(feed.changes_since(0))
+
+
+def test_corrupt_feed_file_restarts_with_full_message(tmp_path: Path):
+    path = tmp_path / "feed.json"
+    feed = SnapshotFeed(path=path)
+    feed.publish(_snapshot())
+    path.write_text(path.read_text()[:20], encoding="utf-8")
+    restarted = SnapshotFeed(path=path)
+    assert restarted.seq == 0
+    assert restarted.publish(_snapshot()) == 1
+    assert "full" in restarted.changes_since(5)
+    assert SnapshotFeed(path=path).seq == 1
+    assert [entry.name for entry in tmp_path.iterdir()] == ["feed.json"]
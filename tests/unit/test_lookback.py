@@ -0,0 +1,75 @@
+from dataclasses import replace
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from marketpulse.config import DEFAULT_CONFIG, MarketPulseConfig
+from marketpulse.engine import breadth_flows, build_signals, build_timeframe_signals, load_data
+from marketpulse.lookback import ema_warmup, plan_lookback
+from marketpulse.providers.breadth import BreadthProviderChain, LocalCsvBreadthProvider
+from marketpulse.providers.market import LocalCsvMarketProvider, MarketDataProviderChain
+from marketpulse.providers.vix import LocalCsvVixProvider, VixProviderChain
+from marketpulse.quality import QualityCache
+
+
+def test_ema_warmup_meets_tolerance():
+    bars = ema_warmup(26, 1e-3)
+    alpha = 2 / 27
+    assert (1 - alpha) ** bars <= 1e-3 < (1 - alpha) ** (bars - 1)
+
+
+def test_plan_is_a_fraction_of_full_history(market_frames):
+    plan = plan_lookback()
+    assert plan.bars["SPY"] < len(market_frames["spy"])
+    assert plan.bars["breadth"] < 400
+    assert plan.bars["VIX"] <= plan.bars["SPY"]
+
+
+def _local_chains(data_dir: Path):
+    return (
+        MarketDataProviderChain([LocalCsvMarketProvider(data_dir)]),
+        VixProviderChain([LocalCsvVixProvider(data_dir)]),
+        BreadthProviderChain([LocalCsvBreadthProvider(data_dir)]),
+    )
+
+
+@pytest.mark.parametrize("tolerance", [DEFAULT_CONFIG.lookback_tolerance, 1e-4])
+def test_trimmed_signals_match_full_history(market_frames, tmp_path: Path, tolerance: float):
+    # The CSVs end years before today and breadth lags the market by 120
+    # sessions, so the plan must count bars back from each file's last row.
+    frames = dict(market_frames, breadth=market_frames["breadth"].iloc[:-120])
+    for name, filename in {"spy": "SPY", "rsp": "RSP", "vix": "VIX", "breadth": "breadth"}.items():
+        frames[name].to_csv(tmp_path / f"{filename}.csv", index=False)
+    config = replace(DEFAULT_CONFIG, lookback_tolerance=tolerance)
+    plan = plan_lookback(config)
+
+    full_bundle = load_data(*_local_chains(tmp_path), quality_cache=QualityCache())
+    trimmed_bundle = load_data(*_local_chains(tmp_path), plan=plan, quality_cache=QualityCache())
+    assert len(trimmed_bundle.panel) < len(full_bundle.panel)
+    assert len(breadth_flows(trimmed_bundle.panel)["ad"]) == plan.rows("breadth")
+
+    full = build_signals(full_bundle, config)
+    full_tf = build_timeframe_signals(full_bundle)
+    short = build_signals(trimmed_bundle, config)
+    short_tf = build_timeframe_signals(trimmed_bundle)
+
+    pairs = list(zip(full, short)) + [
+        pair for timeframe in full_tf for pair in zip(full_tf[timeframe], short_tf[timeframe])
+    ]
+    for expected, actual in pairs:
+        assert expected.name == actual.name
+        assert expected.vote == actual.vote, expected.name
+        # The tolerance bounds the weight left on the truncated seed; the error is that
+        # weight times the seed gap, which is on the order of the value itself.
+        scale = max(abs(expected.value), 1.0)
+        assert np.isclose(actual.value, expected.value, rtol=0, atol=10 * tolerance * scale), expected.name
+
+
+def test_robust_plan_covers_jittered_spans():
+    config = MarketPulseConfig(robust_window_jitter=0.2)
+    plain = plan_lookback(config)
+    robust = plan_lookback(config, robust=True)
+    assert all(robust.bars[series] >= plain.bars[series] for series in plain.bars)
+    assert robust.bars["SPY"] > plain.bars["SPY"]
+    assert robust.bars["breadth"] >= ema_warmup(int(np.ceil(89 * 1.2)), config.lookback_tolerance)
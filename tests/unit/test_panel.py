@@ -0,0 +1,55 @@
+import numpy as np
+import pandas as pd
+
+from marketpulse.panel import FILL_ASOF, FILL_NAN, FILL_ZERO, AlignedPanel
+
+
+def _panel() -> AlignedPanel:
+    calendar = pd.to_datetime(["2024-01-02", "2024-01-03", "2024-01-04", "2024-01-05"])
+    close = pd.Series([10.0, 11.0, 12.0, 13.0], index=calendar)
+    # VIX skips the 4th and reports a non-exchange date (the 6th is a Saturday).
+    vix = pd.Series([15.0, 16.0, 17.0, 18.0], index=pd.to_datetime(["2024-01-02", "2024-01-03", "2024-01-05", "2024-01-06"]))
+    advances = pd.Series([100.0, 200.0], index=pd.to_datetime(["2024-01-03", "2024-01-05"]))
+    volume = pd.Series([1.0, 2.0], index=calendar[:2])
+    return AlignedPanel.align(
+        calendar,
+        {"close": close, "vix": vix, "advances": advances, "volume": volume},
+        {"close": FILL_ASOF, "vix": FILL_ASOF, "advances": FILL_ZERO, "volume": FILL_NAN},
+    )
+
+
+def test_asof_fill_and_masks():
+    panel = _panel()
+    assert panel.array("vix").tolist() == [15.0, 16.0, 16.0, 17.0]
+    assert panel.observed[panel.fields.index("vix")].tolist() == [True, True, False, True]
+    assert panel.last("vix") == 17.0
+
+
+def test_zero_fill_spans_observations_only():
+    panel = _panel()
+    advances = panel.series("advances")
+    assert advances.index[0] == pd.Timestamp("2024-01-03")
+    assert advances.tolist() == [100.0, 0.0, 200.0]
+    assert panel.series("volume").tolist() == [1.0, 2.0]
+
+
+def test_series_is_zero_copy_view():
+    panel = _panel()
+    series = panel.series("close")
+    assert np.shares_memory(series.to_numpy(), panel.values)
+    assert panel.values[panel.fields.index("close")].flags["C_CONTIGUOUS"]
+
+
+def test_joint_mask():
+    panel = _panel()
+    assert panel.mask("close", "vix").tolist() == [True, True, False, True]
+
+
+def test_last_is_nan_without_observations():
+    calendar = pd.to_datetime(["2024-01-02", "2024-01-03"])
+    panel = AlignedPanel.align(
+        calendar,
+        {"close": pd.Series([10.0, 11.0], index=calendar), "vix": pd.Series([], dtype=float)},
+        {"close": FILL_ASOF, "vix": FILL_ASOF},
+    )
+    assert np.isnan(panel.last("vix"))
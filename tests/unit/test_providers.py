@@ -5,6 +5,7 @@ import pandas as pd
 from marketpulse.providers.breadth import LocalCsvBreadthProvider
 from marketpulse.providers.market import LocalCsvMarketProvider
 from marketpulse.providers.vix import LocalCsvVixProvider
+from marketpulse.utils import trim_history
 
 
 def test_local_market_provider_reads_csv(tmp_path: Path):
@@ -25,6 +26,23 @@ def test_local_market_provider_reads_csv(tmp_path: Path):
     assert df["close"].iloc[-1] == 2.2
 
 
+def test_start_hint_does_not_trim_local_csv(tmp_path: Path):
+    data = pd.DataFrame(
+        {
+            "date": ["2024-01-01", "2024-01-02", "2024-01-03"],
+            "open": [1.0, 2.0, 3.0],
+            "high": [1.5, 2.5, 3.5],
+            "low": [0.9, 1.8, 2.8],
+            "close": [1.2, 2.2, 3.2],
+        }
+    )
+    data.to_csv(tmp_path / "SPY.csv", index=False)
+    provider = LocalCsvMarketProvider(data_dir=tmp_path)
+    df = provider.fetch_daily("SPY", start=pd.Timestamp("2025-01-01"))
+    assert df["close"].tolist() == [1.2, 2.2, 3.2]
+    assert trim_history(df, 2)["close"].tolist() == [2.2, 3.2]
+
+
 def test_local_breadth_provider_reads_csv(tmp_path: Path):
     data = pd.DataFrame(
         {
@@ -0,0 +1,66 @@
+import numpy as np
+import pandas as pd
+
+from marketpulse.pyramid import PyramidCache, ResamplePyramid
+
+
+def _daily(periods: int) -> pd.DataFrame:
+    dates = pd.bdate_range("2024-01-01", periods=periods)
+    close = 100 + np.cumsum(np.sin(np.arange(periods)))
+    return pd.DataFrame(
+        {
+            "date": dates,
+            "open": close - 0.5,
+            "high": close + 1.0,
+            "low": close - 1.0,
+            "close": close,
+            "volume": np.full(periods, 10.0),
+        }
+    )
+
+
+def test_weekly_bars_aggregate_ohlc():
+    df = _daily(10)
+    pyramid = ResamplePyramid.build(df)
+    first_week = df.iloc[:5]
+    bar = pyramid.weekly.iloc[0]
+    assert pyramid.weekly.index[0] == pd.Timestamp("2024-01-05")
+    assert bar["open"] == first_week["open"].iloc[0]
+    assert bar["high"] == first_week["high"].max()
+    assert bar["low"] == first_week["low"].min()
+    assert bar["close"] == first_week["close"].iloc[-1]
+    assert bar["volume"] == 50.0
+
+
+def test_incremental_update_matches_rebuild():
+    full = _daily(90)
+    cache = PyramidCache()
+    cache.get("SPY", full.iloc[:60])
+    revised = full.copy()
+    revised.loc[59, "close"] += 3.0
+    updated = cache.get("SPY", revised)
+    rebuilt = ResamplePyramid.build(revised)
+    for timeframe in ("daily", "weekly", "monthly"):
+        pd.testing.assert_frame_equal(updated.frame(timeframe), rebuilt.frame(timeframe), check_freq=False)
+
+
+def test_cache_reuses_unchanged_pyramid():
+    df = _daily(30)
+    cache = PyramidCache()
+    assert cache.get("SPY", df) is cache.get("SPY", df.copy())
+
+
+def test_restated_history_triggers_rebuild():
+    full = _daily(90)
+    cache = PyramidCache()
+    cache.get("SPY", full.iloc[:60])
+    restated = full.copy()
+    restated[["open", "high", "low", "close"]] *= 0.99
+    appended = cache.get("SPY", restated.iloc[:61])
+    rebuilt = ResamplePyramid.build(restated.iloc[:61])
+    pd.testing.assert_frame_equal(appended.weekly, rebuilt.weekly, check_freq=False)
+
+    revised = restated.iloc[:61].copy()
+    revised.loc[10, "close"] = 500.0
+    same_length = cache.get("SPY", revised)
+    pd.testing.assert_frame_equal(same_length.weekly, ResamplePyramid.build(revised).weekly, check_freq=False)
@@ -0,0 +1,106 @@
+import json
+from pathlib import Path
+
+import pandas as pd
+
+from marketpulse import quality
+from marketpulse.quality import TRADING_DAY, QualityCache, validate, validate_breadth, validate_ohlcv, validate_vix
+
+
+def _ohlcv(closes, start="2024-01-02") -> pd.DataFrame:
+    dates = pd.date_range(start, periods=len(closes), freq=TRADING_DAY)
+    close = pd.Series(closes, dtype=float)
+    return pd.DataFrame(
+        {"date": dates, "open": close, "high": close * 1.01, "low": close * 0.99, "close": close, "volume": 1_000}
+    )
+
+
+def _checks(issues) -> dict:
+    return {issue.check: issue.count for issue in issues}
+
+
+def test_clean_series_has_no_issues():
+    assert validate_ohlcv(_ohlcv([100 + i for i in range(60)]), "SPY") == []
+
+
+def test_duplicates_and_gaps_follow_exchange_calendar():
+    df = _ohlcv([100.0] * 10 + [101.0] * 10)
+    df = pd.concat([df.iloc[:5], df.iloc[4:5], df.iloc[7:]], ignore_index=True)
+    checks = _checks(validate_ohlcv(df, "SPY"))
+    assert checks == {"duplicates": 1, "gaps": 2}
+    # 2024-01-15 is MLK day, so its absence is not a gap.
+    holiday = _ohlcv([100.0] * 15)
+    assert pd.Timestamp("2024-01-15") not in set(holiday["date"])
+    assert validate_ohlcv(holiday, "SPY") == []
+
+
+def test_calendar_follows_nyse_closures():
+    # Actual NYSE sessions around the Bush and Carter days of mourning and a
+    # Saturday New Year's Day (the exchange was open on 2021-12-31).
+    windows = [
+        ["2018-12-03", "2018-12-04", "2018-12-06", "2018-12-07"],
+        ["2025-01-06", "2025-01-07", "2025-01-08", "2025-01-10", "2025-01-13"],
+        ["2021-12-29", "2021-12-30", "2021-12-31", "2022-01-03"],
+    ]
+    for dates in windows:
+        vix = pd.DataFrame({"date": pd.to_datetime(dates), "vix": [15.0 + i for i in range(len(dates))]})
+        assert validate_vix(vix) == []
+    skipped = pd.DataFrame({"date": pd.to_datetime(["2021-12-30", "2022-01-03"]), "vix": [15.0, 16.0]})
+    assert _checks(validate_vix(skipped)) == {"gaps": 1}
+
+
+def test_split_jump_is_not_reported_as_outlier():
+    closes = [400.0] * 5 + [200.0] * 5 + [240.0] * 5
+    issues = validate_ohlcv(_ohlcv(closes), "SPY")
+    assert _checks(issues) == {"split_jumps": 1, "outliers": 1}
+    assert str(issues[-1]).startswith("SPY: 1 daily moves beyond 15%")
+
+
+def test_inconsistent_bars_and_bad_prices():
+    df = _ohlcv([100.0] * 5)
+    df.loc[1, "high"] = 95.0
+    df.loc[3, "close"] = 0.0
+    checks = _checks(validate_ohlcv(df, "RSP"))
+    assert checks["ohlc"] == 2
+    assert checks["nonpositive"] == 1
+
+
+def test_stale_vix_and_placeholder_breadth():
+    dates = pd.date_range("2024-01-02", periods=8, freq=TRADING_DAY)
+    vix = pd.DataFrame({"date": dates, "vix": [14.0, 15.0, 15.0, 15.0, 15.0, 16.0, 15.0, 15.0]})
+    assert _checks(validate_vix(vix)) == {"stale": 3}
+
+    breadth = pd.DataFrame(
+        {"date": dates, "advances": [1500, 0, 1600, 1700, 1400, 1300, 1550, 1450], "declines": 1000}
+    )
+    breadth["new_highs"] = 50
+    breadth["new_lows"] = 20
+    breadth.loc[1, "declines"] = 0
+    assert _checks(validate_breadth(breadth)) == {"placeholder": 1}
+
+
+def test_cache_skips_revalidation_until_content_changes(tmp_path: Path, monkeypatch):
+    calls = []
+
+    def counting(df, series):
+        calls.append(series)
+        return validate_ohlcv(df, series)
+
+    monkeypatch.setitem(quality.VALIDATORS, "ohlcv", counting)
+    path = tmp_path / "quality.json"
+    df = _ohlcv([400.0] * 5 + [200.0] * 5)
+    first = validate("ohlcv", "SPY", df, QualityCache(path))
+    assert validate("ohlcv", "SPY", df.copy(), QualityCache(path)) == first
+    assert calls == ["SPY"]
+
+    validate("ohlcv", "SPY", _ohlcv([400.0] * 10), QualityCache(path))
+    assert calls == ["SPY", "SPY"]
+
+
+def test_corrupt_cache_file_is_ignored(tmp_path: Path):
+    path = tmp_path / "quality.json"
+    path.write_text('{"v2:ohlcv:SPY:', encoding="utf-8")
+    df = _ohlcv([100.0] * 5)
+    assert validate("ohlcv", "SPY", df, QualityCache(path)) == []
+    assert QualityCache(path).get(next(iter(json.loads(path.read_text())))) == []
+    assert [entry.name for entry in tmp_path.iterdir()] == ["quality.json"]
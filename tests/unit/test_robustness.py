@@ -0,0 +1,38 @@
+from dataclasses import replace
+
+import numpy as np
+import pytest
+
+from marketpulse.config import DEFAULT_CONFIG
+from marketpulse.engine import SIGNAL_NAMES, DataBundle, build_signals, score_signals
+from marketpulse.models import Vote
+from marketpulse.robustness import estimate_band, sample_votes, scores_from_votes
+
+CODES = {Vote.BULL: 1, Vote.NEUTRAL: 0, Vote.BEAR: -1, Vote.NA: 0}
+
+
+def test_unperturbed_samples_reproduce_engine_votes(market_frames):
+    for breadth in (market_frames["breadth"], None):
+        bundle = DataBundle.from_frames(market_frames["spy"], market_frames["rsp"], market_frames["vix"], breadth)
+        signals = build_signals(bundle)
+        assert tuple(signal.name for signal in signals) == SIGNAL_NAMES
+        votes = sample_votes(bundle, samples=4, rng=np.random.default_rng(0), horizon=0, jitter=0.0)
+        assert votes.tolist() == [[CODES[signal.vote] for signal in signals]] * 4
+        assert scores_from_votes(votes)[0] == score_signals(signals)[0]
+        ranked = replace(DEFAULT_CONFIG, score_rank_signals=True)
+        assert scores_from_votes(votes, ranked)[0] == score_signals(signals, ranked)[0]
+
+
+def test_band_is_reproducible_with_seed(market_frames):
+    bundle = DataBundle.from_frames(**market_frames)
+    first = estimate_band(bundle, samples=300, seed=11)
+    second = estimate_band(bundle, samples=300, seed=11)
+    assert first == second
+    assert 0 <= first.low <= first.median <= first.high <= 100
+    assert abs(sum(first.label_odds.values()) - 1.0) < 1e-9
+
+
+def test_samples_must_be_positive(market_frames):
+    bundle = DataBundle.from_frames(**market_frames)
+    with pytest.raises(ValueError):
+        sample_votes(bundle, samples=0)
@@ -0,0 +1,43 @@
+import math
+
+import numpy as np
+import pandas as pd
+
+from marketpulse.rolling import RollingMoments, RollingRank, rolling_percentile, rolling_zscore
+
+
+def test_rolling_percentile_matches_naive_window():
+    rng = np.random.default_rng(3)
+    series = pd.Series(rng.normal(size=300))
+    result = rolling_percentile(series, 50)
+    expected = series.rolling(50).apply(lambda w: (w <= w[-1]).mean() * 100, raw=True)
+    pd.testing.assert_series_equal(result, expected)
+
+
+def test_rolling_zscore_matches_pandas():
+    rng = np.random.default_rng(4)
+    series = pd.Series(rng.normal(10, 2, size=500))
+    result = rolling_zscore(series, 60)
+    rolling = series.rolling(60)
+    expected = (series - rolling.mean()) / rolling.std()
+    np.testing.assert_allclose(result, expected, equal_nan=True, atol=1e-9)
+
+
+def test_incremental_updates_match_batch():
+    values = [5.0, 1.0, 4.0, 4.0, 2.0, 8.0, 3.0]
+    rank = RollingRank(3)
+    moments = RollingMoments(3)
+    incremental = [(rank.update(v), moments.update(v)) for v in values]
+    batch_rank = rolling_percentile(pd.Series(values), 3)
+    batch_z = rolling_zscore(pd.Series(values), 3)
+    for (pct, z), expected_pct, expected_z in zip(incremental, batch_rank, batch_z):
+        assert (math.isnan(pct) and math.isnan(expected_pct)) or pct == expected_pct
+        assert (math.isnan(z) and math.isnan(expected_z)) or z == expected_z
+    assert len(rank) == 3 and len(moments) == 3
+
+
+def test_missing_values_are_skipped():
+    rank = RollingRank(2, min_periods=1)
+    assert math.isnan(rank.update(float("nan")))
+    assert rank.update(1.0) == 100.0
+    assert len(rank) == 1
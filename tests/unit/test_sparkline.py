@@ -0,0 +1,48 @@
+import numpy as np
+import pandas as pd
+
+from marketpulse.dashboard import changed_rows
+from marketpulse.sparkline import SparklineCache, lttb, sparkline
+
+
+def test_lttb_keeps_endpoints_and_extremes():
+    values = np.zeros(1000)
+    values[437] = 50.0
+    kept = lttb(values, 20)
+    assert len(kept) == 20
+    assert kept[0] == 0 and kept[-1] == 999
+    assert 437 in kept
+    assert np.all(np.diff(kept) > 0)
+
+
+def test_lttb_short_series_is_untouched():
+    assert lttb(np.arange(5.0), 10).tolist() == [0, 1, 2, 3, 4]
+
+
+def test_sparkline_fits_width():
+    line = sparkline(np.sin(np.linspace(0, 20, 5000)), 40)
+    assert len(line) == 40
+    assert set(line) <= set("▁▂▃▄▅▆▇█")
+
+
+def test_sparkline_cache_reuses_until_series_changes():
+    cache = SparklineCache()
+    series = pd.Series(np.arange(100.0))
+    first = cache.get("a", series, 10)
+    assert cache.get("a", series, 10) is first
+    assert cache.get("a", pd.Series(np.arange(101.0)), 10) is not first
+
+
+def test_cache_rerenders_restated_history():
+    cache = SparklineCache()
+    series = pd.Series(np.arange(10.0))
+    first = cache.get("a", series, 10)
+    restated = series.copy()
+    restated.iloc[:5] = [9.0, 8.0, 6.0, 4.0, 0.0]
+    assert cache.get("a", restated, 10) == sparkline(restated.to_numpy(), 10) != first
+
+
+def test_changed_rows_diff():
+    previous = {"A": ("BULL", "▁█", "x"), "B": ("BEAR", "█▁", "y")}
+    current = {"A": ("BULL", "▁█", "x"), "C": ("BULL", "▁▁", "z")}
+    assert changed_rows(previous, current) == (["C"], ["B"])